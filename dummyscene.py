@@ -15,29 +15,60 @@ class Bot(object):
         self.init_orient = init_orient
 
 
+# Positions of goals, waypoints, and route waypoints (shared by all scenes,
+# hence read-only)
+_goals_pos = np.array([[0.0, 0.0], [6.0, 8.0]])
+_waypts_pos = np.concatenate((_goals_pos,
+                              [[0.0, 2.5], [3.0, 6.5], [5.5, 5.5],
+                               [4.5, 3.0], [3.0, 1.0]]))
+_all_routes_waypts_pos = np.array([
+    [0.0, 0.0], [0.0, 2.5], [3.0, 6.5], [6.0, 8.0],
+    [6.0, 8.0], [5.5, 5.5], [4.5, 3.0], [3.0, 1.0], [0.0, 0.0]
+    ])  # contiguous array of positions of all route waypoints
+for _pos in (_goals_pos, _waypts_pos, _all_routes_waypts_pos):
+    _pos.setflags(write=False)
+
+
 class Scene(object):
     """Substitute for V-REP scene."""
 
     goals_names = ["Nest", "Feed1"]
-    goals_pos = [[0.0, 0.0], [6.0, 8.0]] # array
     waypts_names = goals_names + ["Waypoint1", "Waypoint2", "Waypoint3",
                                   "Waypoint4", "Waypoint5"]
-    waypts_pos = goals_pos + [[0.0, 2.5], [3.0, 6.5], [5.5, 5.5], [4.5, 3.0],
-                              [3.0, 1.0]] # array
     routes_names = ["Route1", "Route2"]
     routes_waypts_names = [
         ["Nest", "Waypoint1", "Waypoint2", "Feed1"],
         ["Feed1", "Waypoint3", "Waypoint4", "Waypoint5", "Nest"]
         ]
-    routes_waypts_pos = [
-        [[0.0, 0.0], [0.0, 2.5], [3.0, 6.5], [6.0, 8.0]],
-        [[6.0, 8.0], [5.5, 5.5], [4.5, 3.0], [3.0, 1.0], [0.0, 0.0]]
-        ] # list of arrays
 
     def __init__(self, params):
         self.bot = Bot(params.bot_init_pos, params.bot_init_orient)
-        self.goals_pos = np.array(self.goals_pos, dtype=float)
-        self.waypts_pos = np.array(self.waypts_pos, dtype=float)
-        self.routes_waypts_pos = \
-            [np.array(route_waypts_pos, dtype=float)
-             for route_waypts_pos in self.routes_waypts_pos]
+        self.goals_pos = _goals_pos
+        self.waypts_pos = _waypts_pos
+        self.routes_waypts_offsets = np.cumsum(
+            [0] + [len(route_waypts_names)
+                   for route_waypts_names in self.routes_waypts_names])
+        self.all_routes_waypts_pos = _all_routes_waypts_pos
+        self.routes_waypts_pos = np.split(
+            self.all_routes_waypts_pos,
+            self.routes_waypts_offsets[1:-1])  # list of views
+
+        # Map names of goals, waypoints, and routes to their indices
+        self._goals_idxs = dict(
+            (name, i) for i, name in enumerate(self.goals_names))
+        self._waypts_idxs = dict(
+            (name, i) for i, name in enumerate(self.waypts_names))
+        self._routes_idxs = dict(
+            (name, i) for i, name in enumerate(self.routes_names))
+
+    def goal_index(self, goal_name):
+        """Return index of a goal."""
+        return self._goals_idxs[goal_name]
+
+    def route_index(self, route_name):
+        """Return index of a route."""
+        return self._routes_idxs[route_name]
+
+    def waypt_index(self, waypt_name):
+        """Return index of a waypoint."""
+        return self._waypts_idxs[waypt_name]
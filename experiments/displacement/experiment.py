@@ -51,10 +51,13 @@ __author__ = "Przemyslaw (Mack) Nowak"
 
 import argparse
 import datetime
+import math
 import os
 import platform
+import timeit
 import warnings
 
+import nengo
 import numpy as np
 import simtools
 import vrepsim as vrs
@@ -75,9 +78,9 @@ saved_params = [
     'bot_init_pos', 'bot_releasepts_orients', 'bot_releasepts_pos',
     'catch_area_radius', 'catch_vec_core', 'catch_vec_thres', 'goal',
     'init_global_vec', 'nengo_backend', 'nengo_sim_dt', 'np_seed', 'prb_syn',
-    'scene_filename', 'scene_radius', 'sim_cycle_duration', 'sim_duration',
-    'sp_dim', 'sp_max_similarity', 'vrep_dyn_eng_dt', 'vrep_dyn_eng_name',
-    'vrep_sim_dt'
+    'saved_data_binary', 'scene_filename', 'scene_radius',
+    'sim_cycle_duration', 'sim_duration', 'sp_dim', 'sp_max_similarity',
+    'vrep_dyn_eng_dt', 'vrep_dyn_eng_name', 'vrep_sim_dt'
     ]
 
 # Process command line arguments
@@ -102,13 +105,6 @@ assert __version__ == params.experiment_version, \
 assert params.nengo_backend in ('nengo', 'nengo_ocl'), \
     "Backend '{}' is not supported.".format(params.nengo_backend)
 
-# Import appropriate Nengo backend
-if params.nengo_backend == 'nengo':
-    import nengo
-elif params.nengo_backend == 'nengo_ocl':
-    import nengo_ocl
-    import pyopencl as cl
-
 # Validate option to save simulation data
 if options.save_data:
     assert params.saved_data, "Simulation data to be saved is not specified."
@@ -132,6 +128,11 @@ n_sim_cycles = params.sim_duration / params.sim_cycle_duration
 assert n_sim_cycles == round(n_sim_cycles), \
     "Simulation duration is not evenly divisible by simulation cycle duration."
 
+# Retrieve coordinates of the point of displacement and squared distance
+# threshold (as plain floats used in the simulation loop)
+bot_displacept_x, bot_displacept_y = map(float, params.bot_displacept_pos)
+bot_displacept_sq_dist_thres = float(params.bot_displacept_dist_thres)**2
+
 # Retrieve number of displacements
 n_displaces = len(params.bot_releasepts_pos)
 
@@ -166,6 +167,10 @@ try:
     assert params.goal in scene.goals_names, \
         "Goal '{}' is invalid.".format(params.goal)
 
+    # Retrieve robot position (reused below to avoid redundant remote API
+    # calls)
+    bot_pos = scene.bot.get_position()
+
     # Validate initial global vector
     if params.init_global_vec is not None:
         if params.bot_init_pos is not None:
@@ -173,17 +178,17 @@ try:
                 warnings.warn("Initial global vector and initial robot "
                               "position are different.")
         else:
-            bot_init_pos = [round(p, 2) for p in scene.bot.get_position()[:2]]
+            bot_init_pos = [round(p, 2) for p in bot_pos[:2]]
             if params.init_global_vec != bot_init_pos:
                 warnings.warn("Initial global vector and initial robot "
                               "position are different.")
 
     # Update robot initial position
     if params.bot_init_pos is not None:
-        scene.bot.set_position(
-            params.bot_init_pos+[scene.bot.get_position()[2]])
+        bot_pos = params.bot_init_pos + bot_pos[2:]
+        scene.bot.set_position(bot_pos)
     else:
-        params.bot_init_pos = scene.bot.get_position()[:2]
+        params.bot_init_pos = bot_pos[:2]
 
     # Update robot initial orientation
     if params.bot_init_orient is not None:
@@ -194,7 +199,7 @@ try:
 
     # If necessary, update initial global vector
     if params.init_global_vec is None:
-        params.init_global_vec = scene.bot.get_position()[:2]
+        params.init_global_vec = bot_pos[:2]
 
     # Add V-REP dynamics engine name to parameters
     params.vrep_dyn_eng_name = vrep_sim.get_dyn_eng_name()
@@ -218,16 +223,18 @@ try:
     try:
         # Run simulation for the specified time or until the goal is reached
         if options.verbose:
-            start_time = datetime.datetime.now().replace(microsecond=0)
+            start_time = timeit.default_timer()
         if params.nengo_backend == 'nengo':
             nengo_sim = nengo.Simulator(model, dt=params.nengo_sim_dt)
         elif params.nengo_backend == 'nengo_ocl':
+            import nengo_ocl  # deferred as importing OpenCL is costly
+            import pyopencl as cl
             nengo_sim = nengo_ocl.Simulator(model, dt=params.nengo_sim_dt)
         if options.verbose:
-            end_time = datetime.datetime.now().replace(microsecond=0)
-            sim_build_time = end_time - start_time
+            end_time = timeit.default_timer()
+            sim_build_time = datetime.timedelta(
+                seconds=round(end_time - start_time))
             start_time = end_time
-        bot_displacept_pos = np.array(params.bot_displacept_pos, dtype=float)
         displace_no = 0
         with nengo_sim:
             while nengo_sim.time < params.sim_duration:
@@ -236,8 +243,7 @@ try:
                 if model.goal_reached:
                     scene.bot.wheels.set_velocities((0.0, 0.0))
                     if options.verbose:
-                        end_time = \
-                            datetime.datetime.now().replace(microsecond=0)
+                        end_time = timeit.default_timer()
                         print("Goal '{}' was reached.".format(params.goal))
                     break
 
@@ -245,10 +251,10 @@ try:
                 # robot should be displaced, displace the robot to a release
                 # position
                 if displace_no < n_displaces:
-                    bot_pos = scene.bot.get_position()[:2]
-                    bot_displacept_dist = np.sqrt(
-                        ((bot_displacept_pos - bot_pos)**2).sum())
-                    if bot_displacept_dist < params.bot_displacept_dist_thres:
+                    bot_x, bot_y = scene.bot.get_position()[:2]
+                    bot_displacept_sq_dist = ((bot_displacept_x - bot_x)**2
+                                              + (bot_displacept_y - bot_y)**2)
+                    if bot_displacept_sq_dist < bot_displacept_sq_dist_thres:
                         scene.move_bot(
                             params.bot_releasepts_pos[displace_no],
                             params.bot_releasepts_orients[displace_no])
@@ -262,15 +268,16 @@ try:
                 # time is up, stop the wheels and stop moving
                 scene.bot.wheels.set_velocities((0.0, 0.0))
                 if options.verbose:
-                    end_time = datetime.datetime.now().replace(microsecond=0)
+                    end_time = timeit.default_timer()
                     print("Time is up, goal '{}' was not reached."
                           "".format(params.goal))
             if options.verbose:
-                sim_run_time = end_time - start_time
-                bot_pos = scene.bot.get_position()[:2]
-                goal_idx = scene.goals_names.index(params.goal)
-                goal_pos = scene.goals_pos[goal_idx]
-                bot_goal_dist = np.sqrt(((goal_pos - bot_pos)**2).sum())
+                sim_run_time = datetime.timedelta(
+                    seconds=round(end_time - start_time))
+                bot_x, bot_y = scene.bot.get_position()[:2]
+                goal_pos = model.goal_pos
+                bot_goal_dist = math.hypot(goal_pos[0] - bot_x,
+                                           goal_pos[1] - bot_y)
                 print("Simulation time: {:.3f} s.".format(nengo_sim.time))
                 print("Distance to goal: {:.2f} m.".format(bot_goal_dist))
                 print("Displacements: {}.".format(displace_no))
@@ -294,10 +301,7 @@ try:
         simtools.save_platform(platform_filename)
 
         # Save software versions
-        versions_info = [
-            ('model', model_version),
-            ('experiment', __version__),
-            ('python', platform.python_version()),
+        libs_versions_info = [
             ('nengo', nengo.__version__),
             ('numpy', np.__version__),
             ('simtools', simtools.__version__),
@@ -305,11 +309,16 @@ try:
             ('vrepsim', vrs.__version__)
             ]
         if params.nengo_backend == 'nengo_ocl':
-            versions_info.extend([
+            libs_versions_info.extend([
                 ('nengo_ocl', nengo_ocl.__version__),
                 ('pyopencl', cl.VERSION_TEXT)
                 ])
-            versions_info = versions_info[:3] + sorted(versions_info[3:])
+            libs_versions_info.sort()
+        versions_info = [
+            ('model', model_version),
+            ('experiment', __version__),
+            ('python', platform.python_version())
+            ] + libs_versions_info
         simtools.save_versions(versions_filename, versions_info)
 
 finally:
@@ -48,4 +48,5 @@ saved_data = [
     'thal', 'view', 'view7view', 'view_routept', 'views_vocab', 'vision',
     'waypts_names', 'waypts_pos', 'wheel_speeds'
     ]
+saved_data_binary = False
 prb_syn = 0.005
@@ -86,6 +86,7 @@ This module was developed for Nengo 2.7.0 and V-REP 3.4.0.
 __version__ = '1.0'
 __author__ = "Przemyslaw (Mack) Nowak"
 
+import math
 import os
 import warnings
 
@@ -100,77 +101,115 @@ import numpy as np
 class Model(spa.SPA):
     """Nengo model of ant navigation along established idiosyncratic routes."""
 
-    probeable = (
-        'action_names', 'bg', 'bot_orient', 'bot_pos', 'catch_area',
-        'catch_vec', 'displace', 'gain_catch_vec', 'gain_catch_vec_neurons',
-        'gate_reset', 'gate_routept_cleanup', 'gate_target_vec',
-        'gate_target_vec_goal', 'gate_view_routept', 'global_vec', 'goal',
-        'goal_neurons', 'goal0view', 'goal_detect', 'goal_input',
-        'goals2goals_vecs', 'goals_names', 'goals_vocab', 'motion_vec',
-        'motion_vec_neurons', 'next_routept', 'next_routept_neurons',
-        'norm_target_vec', 'prev2next_routepts', 'prev_routept',
-        'prev_routept_neurons', 'routept_cleanup', 'routepts2norm_local_vecs',
-        'routepts2views', 'routepts_vocab', 'routes_waypts_names',
-        'routes_waypts_pos', 'scaled_catch_vec', 'scaled_local_vec',
-        'scaled_target_vec', 'target_vec', 'target_vec_neurons', 'thal',
-        'thal_neurons', 'view', 'view_neurons', 'view7view', 'view_routept',
-        'view_routept_neurons', 'views_vocab', 'vision', 'waypts_names',
-        'waypts_pos', 'wheel_speeds'
-        )
-    action_names_filename = "actionname.txt"
-    bg_filename = "bg.txt"
-    bot_orient_filename = "botorient.txt"
-    bot_pos_filename = "botpos.txt"
-    catch_area_filename = "catcharea.txt"
-    catch_vec_filename = "catchvec.txt"
-    displace_filename = "displace.txt"
-    gain_catch_vec_filename = "gaincatchvec.txt"
-    gain_catch_vec_neurons_filename = "gaincatchvecnrn.npz"
-    gate_reset_filename = "gatereset.txt"
-    gate_routept_cleanup_filename = "gaterouteptcleanup.txt"
-    gate_target_vec_filename = "gatetargetvec.txt"
-    gate_target_vec_goal_filename = "gatetargetvecgoal.txt"
-    gate_view_routept_filename = "gateviewroutept.txt"
-    global_vec_filename = "globalvec.txt"
-    goal_filename = "goal.txt"
-    goal_neurons_filename = "goalnrn.npz"
-    goal0view_filename = "goal0view.txt"
-    goal_detect_filename = "goaldetect.txt"
-    goal_input_filename = "goalinput.txt"
-    goals2goals_vecs_filename = "goal2goalvec.txt"
-    goals_names_filename = "goalname.txt"
-    goals_vocab_filename = "goalvocab.txt"
-    motion_vec_filename = "motionvec.txt"
-    motion_vec_neurons_filename = "motionvecnrn.npz"
-    next_routept_filename = "nextroutept.txt"
-    next_routept_neurons_filename = "nextrouteptnrn.npz"
-    norm_target_vec_filename = "normtargetvec.txt"
-    prev2next_routepts_filename = "prev2nextroutept.txt"
-    prev_routept_filename = "prevroutept.txt"
-    prev_routept_neurons_filename = "prevrouteptnrn.npz"
-    routept_cleanup_filename = "routeptcleanup.txt"
-    routepts2norm_local_vecs_filename = "routept2normlocalvec.txt"
-    routepts2views_filename = "routept2view.txt"
-    routepts_vocab_filename = "routeptvocab.txt"
-    routes_waypts_names_filename = "routewayptname.txt"
-    routes_waypts_pos_filename = "routewayptpos.txt"
-    scaled_catch_vec_filename = "scaledcatchvec.txt"
-    scaled_local_vec_filename = "scaledlocalvec.txt"
-    scaled_target_vec_filename = "scaledtargetvec.txt"
-    target_vec_filename = "targetvec.txt"
-    target_vec_neurons_filename = "targetvecnrn.npz"
-    thal_filename = "thal.txt"
-    thal_neurons_filename = "thalnrn.npz"
-    view_filename = "view.txt"
-    view_neurons_filename = "viewnrn.npz"
-    view7view_filename = "view7view.txt"
-    view_routept_filename = "viewroutept.txt"
-    view_routept_neurons_filename = "viewrouteptnrn.npz"
-    views_vocab_filename = "viewvocab.txt"
-    vision_filename = "vision.txt"
-    wheel_speeds_filename = "wheelspeed.txt"
-    waypts_names_filename = "wayptname.txt"
-    waypts_pos_filename = "wayptpos.txt"
+    data_filenames = {
+        'action_names': "actionname.txt",
+        'bg': "bg.txt",
+        'bot_orient': "botorient.txt",
+        'bot_pos': "botpos.txt",
+        'catch_area': "catcharea.txt",
+        'catch_vec': "catchvec.txt",
+        'displace': "displace.txt",
+        'gain_catch_vec': "gaincatchvec.txt",
+        'gain_catch_vec_neurons': "gaincatchvecnrn.npz",
+        'gate_reset': "gatereset.txt",
+        'gate_routept_cleanup': "gaterouteptcleanup.txt",
+        'gate_target_vec': "gatetargetvec.txt",
+        'gate_target_vec_goal': "gatetargetvecgoal.txt",
+        'gate_view_routept': "gateviewroutept.txt",
+        'global_vec': "globalvec.txt",
+        'goal': "goal.txt",
+        'goal_neurons': "goalnrn.npz",
+        'goal0view': "goal0view.txt",
+        'goal_detect': "goaldetect.txt",
+        'goal_input': "goalinput.txt",
+        'goals2goals_vecs': "goal2goalvec.txt",
+        'goals_names': "goalname.txt",
+        'goals_vocab': "goalvocab.txt",
+        'motion_vec': "motionvec.txt",
+        'motion_vec_neurons': "motionvecnrn.npz",
+        'next_routept': "nextroutept.txt",
+        'next_routept_neurons': "nextrouteptnrn.npz",
+        'norm_target_vec': "normtargetvec.txt",
+        'prev2next_routepts': "prev2nextroutept.txt",
+        'prev_routept': "prevroutept.txt",
+        'prev_routept_neurons': "prevrouteptnrn.npz",
+        'routept_cleanup': "routeptcleanup.txt",
+        'routepts2norm_local_vecs': "routept2normlocalvec.txt",
+        'routepts2views': "routept2view.txt",
+        'routepts_vocab': "routeptvocab.txt",
+        'routes_waypts_names': "routewayptname.txt",
+        'routes_waypts_pos': "routewayptpos.txt",
+        'scaled_catch_vec': "scaledcatchvec.txt",
+        'scaled_local_vec': "scaledlocalvec.txt",
+        'scaled_target_vec': "scaledtargetvec.txt",
+        'target_vec': "targetvec.txt",
+        'target_vec_neurons': "targetvecnrn.npz",
+        'thal': "thal.txt",
+        'thal_neurons': "thalnrn.npz",
+        'view': "view.txt",
+        'view_neurons': "viewnrn.npz",
+        'view7view': "view7view.txt",
+        'view_routept': "viewroutept.txt",
+        'view_routept_neurons': "viewrouteptnrn.npz",
+        'views_vocab': "viewvocab.txt",
+        'vision': "vision.txt",
+        'wheel_speeds': "wheelspeed.txt",
+        'waypts_names': "wayptname.txt",
+        'waypts_pos': "wayptpos.txt"
+        }
+    probeable = tuple(sorted(data_filenames))
+
+    # Specifications of saved dynamic data: whether data is sampled every V-REP
+    # simulation time step (instead of every Nengo simulation time step), kind
+    # of data ('value', 'similarity', or 'neurons'), and formats of data
+    # columns other than time (None denotes '%.6f' for every column)
+    _dynamic_data_specs = {
+        'bot_pos': (True, 'value', ["%.6f", "%.6f"]),
+        'bot_orient': (True, 'value', ["%.4f"]),
+        'global_vec': (True, 'value', ["%.6f", "%.6f"]),
+        'catch_area': (True, 'value', ["%d", "%.6f"]),
+        'catch_vec': (True, 'value', ["%.6f", "%.6f", "%.6f"]),
+        'vision': (True, 'similarity', None),
+        'displace': (False, 'value', ["%d"]),
+        'goal_input': (False, 'similarity', None),
+        'goal': (False, 'similarity', None),
+        'goal_neurons': (False, 'neurons', None),
+        'goal_detect': (False, 'value', ["%d"]),
+        'goals2goals_vecs': (False, 'value', ["%.6f", "%.6f"]),
+        'target_vec': (False, 'value', ["%.6f", "%.6f"]),
+        'target_vec_neurons': (False, 'neurons', None),
+        'gate_target_vec': (False, 'value', ["%.6f"]),
+        'gate_target_vec_goal': (False, 'value', ["%.6f"]),
+        'norm_target_vec': (False, 'value', ["%.6f", "%.6f"]),
+        'view': (False, 'similarity', None),
+        'view_neurons': (False, 'neurons', None),
+        'goal0view': (False, 'similarity', None),
+        'view_routept': (False, 'similarity', None),
+        'view_routept_neurons': (False, 'neurons', None),
+        'gate_view_routept': (False, 'value', ["%.6f"]),
+        'prev_routept': (False, 'similarity', None),
+        'prev_routept_neurons': (False, 'neurons', None),
+        'routept_cleanup': (False, 'similarity', None),
+        'prev2next_routepts': (False, 'similarity', None),
+        'next_routept': (False, 'similarity', None),
+        'next_routept_neurons': (False, 'neurons', None),
+        'gate_routept_cleanup': (False, 'value', ["%.6f"]),
+        'routepts2views': (False, 'similarity', None),
+        'view7view': (False, 'value', ["%.6f"]),
+        'routepts2norm_local_vecs': (False, 'value', ["%.6f", "%.6f"]),
+        'gain_catch_vec': (False, 'value', ["%.6f"]),
+        'gain_catch_vec_neurons': (False, 'neurons', None),
+        'scaled_catch_vec': (False, 'value', ["%.6f", "%.6f"]),
+        'scaled_local_vec': (False, 'value', ["%.6f", "%.6f"]),
+        'scaled_target_vec': (False, 'value', ["%.6f", "%.6f"]),
+        'motion_vec': (False, 'value', ["%.6f", "%.6f"]),
+        'motion_vec_neurons': (False, 'neurons', None),
+        'wheel_speeds': (False, 'value', ["%.6f", "%.6f"]),
+        'gate_reset': (False, 'value', ["%.6f"]),
+        'bg': (False, 'value', None),
+        'thal': (False, 'value', None),
+        'thal_neurons': (False, 'neurons', None)
+        }
 
     def __init__(self, params, scene, vrep_comm=None):
         super(Model, self).__init__()
@@ -179,11 +218,17 @@ class Model(spa.SPA):
         self.vrep_comm = vrep_comm
         self._goal_reached = False
         self._goal_name = None
+        self._goal_pos = None
         self._new_goal_name = "NONE"
         self._displaced = False
         self.validate_params(self.params, self.scene)
+        self._saved_data = frozenset(self.params.saved_data or ())
+        self._saved_data_binary = getattr(self.params, 'saved_data_binary',
+                                          False)
         self._make_model()
-        if self.params.saved_data:
+        if self._saved_data:
+            self._t_prec = "%.{}f".format(
+                len(repr(self.params.nengo_sim_dt).split(".")[-1]))
             self._make_probes()
 
     @property
@@ -191,39 +236,50 @@ class Model(spa.SPA):
         """Flag indicating whether goal is reached."""
         return self._goal_reached
 
+    @property
+    def goal_pos(self):
+        """Position of current goal."""
+        return self._goal_pos
+
     @classmethod
     def validate_params(cls, params, scene):
         """Validate parameters."""
 
         # Validate number of goals
-        assert len(scene.goals_names) >= 2, "Number of goals is less than 2."
+        if len(scene.goals_names) < 2:
+            raise ValueError("Number of goals is less than 2.")
 
         # Validate names of goals
         for goal_name in scene.goals_names:
-            assert goal_name.upper() != "NONE", \
-                "Goal name '{}' is not allowed.".format(goal_name)
+            if goal_name.upper() == "NONE":
+                raise ValueError(
+                    "Goal name '{}' is not allowed.".format(goal_name))
 
         # Validate radius of catchment areas
-        min_waypts_dist = np.sqrt(
-            min(((pos1 - pos2)**2).sum()
-                for p, pos1 in enumerate(scene.waypts_pos)
-                for pos2 in scene.waypts_pos[p+1:]))
-        assert params.catch_area_radius < min_waypts_dist / 2, \
-            ("Radius of catchment areas is not less than half of the minimum "
-             "distance between waypoints: {}.".format(min_waypts_dist / 2))
+        waypts_diffs = scene.waypts_pos[:,np.newaxis] - scene.waypts_pos
+        waypts_square_dists = (waypts_diffs**2).sum(axis=2)
+        np.fill_diagonal(waypts_square_dists, np.inf)
+        min_waypts_dist = np.sqrt(waypts_square_dists.min())
+        if params.catch_area_radius >= min_waypts_dist / 2:
+            raise ValueError(
+                "Radius of catchment areas is not less than half of the "
+                "minimum distance between waypoints: {}."
+                "".format(min_waypts_dist / 2))
 
         # Validate core region of catchment vector
-        assert params.catch_vec_core < 1.0, \
-            "Core region of catchment vector is not less than 1."
+        if params.catch_vec_core >= 1.0:
+            raise ValueError(
+                "Core region of catchment vector is not less than 1.")
 
         # Validate number of routes
-        assert len(scene.routes_names) >= 1, "Number of routes is less than 1."
+        if len(scene.routes_names) < 1:
+            raise ValueError("Number of routes is less than 1.")
 
         # Validate routes
         for r, route_waypts_names in enumerate(scene.routes_waypts_names):
-            assert route_waypts_names[-1] in scene.goals_names, \
-                ("Route {} does not end with one of the goals."
-                 "".format(scene.routes_names[r]))
+            if route_waypts_names[-1] not in scene.goals_names:
+                raise ValueError("Route {} does not end with one of the goals."
+                                 "".format(scene.routes_names[r]))
 
         # Validate data to be saved
         if params.saved_data:
@@ -239,274 +295,70 @@ class Model(spa.SPA):
     def save_data(self, sim, dirname=None):
         """Save collected data."""
 
+        # If no data is to be saved, there is nothing to do
+        if not self._saved_data:
+            return
+
         # If necessary, adjust directory name
         if dirname is None:
             dirname = ""
 
         # Save static data
-        if 'goals_names' in self.params.saved_data:
-            np.savetxt(os.path.join(dirname, self.goals_names_filename),
-                       self.scene.goals_names, "%s")
-        if 'waypts_names' in self.params.saved_data:
-            np.savetxt(os.path.join(dirname, self.waypts_names_filename),
-                       self.scene.waypts_names, "%s")
-        if 'waypts_pos' in self.params.saved_data:
-            np.savetxt(os.path.join(dirname, self.waypts_pos_filename),
-                       self.scene.waypts_pos, "%.6f")
-        if 'routes_waypts_names' in self.params.saved_data:
-            data = [[], []]
-            for r, route_waypts_names \
-                in enumerate(self.scene.routes_waypts_names):
-                data[0].extend([r + 1] * len(route_waypts_names))
-                data[1].extend(route_waypts_names)
-            np.savetxt(
-                os.path.join(dirname, self.routes_waypts_names_filename),
-                np.array(data).T, "%s")
-        if 'routes_waypts_pos' in self.params.saved_data:
-            data = [[], []]
-            for r, route_waypts_pos in enumerate(self.scene.routes_waypts_pos):
-                data[0].extend([[r + 1]] * len(route_waypts_pos))
-                data[1].extend(route_waypts_pos)
-            np.savetxt(
-                os.path.join(dirname, self.routes_waypts_pos_filename),
-                np.concatenate(data, axis=1), ["%d", "%.6f", "%.6f"])
-        if 'action_names' in self.params.saved_data:
+        filenames = dict((name, os.path.join(dirname, filename))
+                         for name, filename in self.data_filenames.items())
+        if 'goals_names' in self._saved_data:
+            np.savetxt(filenames['goals_names'], self.scene.goals_names, "%s")
+        if 'waypts_names' in self._saved_data:
+            np.savetxt(filenames['waypts_names'], self.scene.waypts_names,
+                       "%s")
+        if 'waypts_pos' in self._saved_data:
+            np.savetxt(filenames['waypts_pos'], self.scene.waypts_pos, "%.6f")
+        if ('routes_waypts_names' in self._saved_data
+            or 'routes_waypts_pos' in self._saved_data):
+            routes_ids = np.repeat(
+                np.arange(1, len(self.scene.routes_names) + 1),
+                [len(route_waypts_names)
+                 for route_waypts_names in self.scene.routes_waypts_names])
+        if 'routes_waypts_names' in self._saved_data:
+            data = np.column_stack(
+                (routes_ids.astype(str),
+                 np.concatenate(self.scene.routes_waypts_names)))
+            np.savetxt(filenames['routes_waypts_names'], data, "%s")
+        if 'routes_waypts_pos' in self._saved_data:
+            data = np.column_stack(
+                (routes_ids, self.scene.all_routes_waypts_pos))
+            np.savetxt(filenames['routes_waypts_pos'], data,
+                       ["%d", "%.6f", "%.6f"])
+        if 'action_names' in self._saved_data:
             data = [action.name for action in self.bg.actions.actions]
-            np.savetxt(os.path.join(dirname, self.action_names_filename), data,
+            np.savetxt(filenames['action_names'], data, "%s")
+        if 'goals_vocab' in self._saved_data:
+            np.savetxt(filenames['goals_vocab'], self.goals_vocab.keys, "%s")
+        if 'routepts_vocab' in self._saved_data:
+            np.savetxt(filenames['routepts_vocab'], self.routepts_vocab.keys,
                        "%s")
-        if 'goals_vocab' in self.params.saved_data:
-            np.savetxt(os.path.join(dirname, self.goals_vocab_filename),
-                       self.goals_vocab.keys, "%s")
-        if 'routepts_vocab' in self.params.saved_data:
-            np.savetxt(os.path.join(dirname, self.routepts_vocab_filename),
-                       self.routepts_vocab.keys, "%s")
-        if 'views_vocab' in self.params.saved_data:
-            np.savetxt(os.path.join(dirname, self.views_vocab_filename),
-                       self.views_vocab.keys, "%s")
+        if 'views_vocab' in self._saved_data:
+            np.savetxt(filenames['views_vocab'], self.views_vocab.keys, "%s")
 
         # Save dynamic data
-        t_prec = "%.{}f".format(
-            len(repr(self.params.nengo_sim_dt).split(".")[-1]))
-        t = sim.trange(self.params.vrep_sim_dt)[:,np.newaxis]
-        if 'bot_pos' in self.params.saved_data:
-            data = sim.data[self.bot_pos_prb]
-            np.savetxt(os.path.join(dirname, self.bot_pos_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%.6f", "%.6f"])
-        if 'bot_orient' in self.params.saved_data:
-            data = sim.data[self.bot_orient_prb]
-            np.savetxt(os.path.join(dirname, self.bot_orient_filename),
-                       np.concatenate((t, data), axis=1), [t_prec, "%.4f"])
-        if 'global_vec' in self.params.saved_data:
-            data = sim.data[self.global_vec_prb]
-            np.savetxt(os.path.join(dirname, self.global_vec_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%.6f", "%.6f"])
-        if 'catch_area' in self.params.saved_data:
-            data = sim.data[self.catch_area_prb]
-            np.savetxt(os.path.join(dirname, self.catch_area_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%d", "%.6f"])
-        if 'catch_vec' in self.params.saved_data:
-            data = sim.data[self.catch_vec_prb]
-            np.savetxt(os.path.join(dirname, self.catch_vec_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%.6f", "%.6f", "%.6f"])
-        if 'vision' in self.params.saved_data:
-            data = spa.similarity(sim.data[self.vision_prb], self.views_vocab)
-            np.savetxt(os.path.join(dirname, self.vision_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        t = sim.trange()[:,np.newaxis]
-        if 'displace' in self.params.saved_data:
-            data = sim.data[self.displace_prb]
-            np.savetxt(os.path.join(dirname, self.displace_filename),
-                       np.concatenate((t, data), axis=1), [t_prec, "%d"])
-        if 'goal_input' in self.params.saved_data:
-            data = spa.similarity(sim.data[self.goal_input_prb][:,1:],
-                                  self.goals_vocab)
-            np.savetxt(os.path.join(dirname, self.goal_input_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'goal' in self.params.saved_data:
-            data = self.similarity(sim.data, self.goal_prb)
-            np.savetxt(os.path.join(dirname, self.goal_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'goal_neurons' in self.params.saved_data:
-            data = sim.data[self.goal_neurons_prb]
-            np.savez_compressed(
-                os.path.join(dirname, self.goal_neurons_filename),
-                data=np.concatenate((t, data), axis=1))
-        if 'goal_detect' in self.params.saved_data:
-            data = sim.data[self.goal_detect_prb]
-            np.savetxt(os.path.join(dirname, self.goal_detect_filename),
-                       np.concatenate((t, data), axis=1), [t_prec, "%d"])
-        if 'goals2goals_vecs' in self.params.saved_data:
-            data = sim.data[self.goals2goals_vecs_prb]
-            np.savetxt(os.path.join(dirname, self.goals2goals_vecs_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%.6f", "%.6f"])
-        if 'target_vec' in self.params.saved_data:
-            data = sim.data[self.target_vec_prb]
-            np.savetxt(os.path.join(dirname, self.target_vec_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%.6f", "%.6f"])
-        if 'target_vec_neurons' in self.params.saved_data:
-            data = sim.data[self.target_vec_neurons_prb]
-            np.savez_compressed(
-                os.path.join(dirname, self.target_vec_neurons_filename),
-                data=np.concatenate((t, data), axis=1))
-        if 'gate_target_vec' in self.params.saved_data:
-            data = sim.data[self.gate_target_vec_prb]
-            np.savetxt(os.path.join(dirname, self.gate_target_vec_filename),
-                       np.concatenate((t, data), axis=1), [t_prec, "%.6f"])
-        if 'gate_target_vec_goal' in self.params.saved_data:
-            data = sim.data[self.gate_target_vec_goal_prb]
-            np.savetxt(
-                os.path.join(dirname, self.gate_target_vec_goal_filename),
-                np.concatenate((t, data), axis=1), [t_prec, "%.6f"])
-        if 'norm_target_vec' in self.params.saved_data:
-            data = sim.data[self.norm_target_vec_prb]
-            np.savetxt(os.path.join(dirname, self.norm_target_vec_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%.6f", "%.6f"])
-        if 'view' in self.params.saved_data:
-            data = self.similarity(sim.data, self.view_prb)
-            np.savetxt(os.path.join(dirname, self.view_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'view_neurons' in self.params.saved_data:
-            data = sim.data[self.view_neurons_prb]
-            np.savez_compressed(
-                os.path.join(dirname, self.view_neurons_filename),
-                data=np.concatenate((t, data), axis=1))
-        if 'goal0view' in self.params.saved_data:
-            data = self.similarity(sim.data, self.goal0view_prb)
-            np.savetxt(os.path.join(dirname, self.goal0view_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'view_routept' in self.params.saved_data:
-            data = self.similarity(sim.data, self.view_routept_prb)
-            np.savetxt(os.path.join(dirname, self.view_routept_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'view_routept_neurons' in self.params.saved_data:
-            data = sim.data[self.view_routept_neurons_prb]
-            np.savez_compressed(
-                os.path.join(dirname, self.view_routept_neurons_filename),
-                data=np.concatenate((t, data), axis=1))
-        if 'gate_view_routept' in self.params.saved_data:
-            data = sim.data[self.gate_view_routept_prb]
-            np.savetxt(os.path.join(dirname, self.gate_view_routept_filename),
-                       np.concatenate((t, data), axis=1), [t_prec, "%.6f"])
-        if 'prev_routept' in self.params.saved_data:
-            data = self.similarity(sim.data, self.prev_routept_prb)
-            np.savetxt(os.path.join(dirname, self.prev_routept_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'prev_routept_neurons' in self.params.saved_data:
-            data = sim.data[self.prev_routept_neurons_prb]
-            np.savez_compressed(
-                os.path.join(dirname, self.prev_routept_neurons_filename),
-                data=np.concatenate((t, data), axis=1))
-        if 'routept_cleanup' in self.params.saved_data:
-            data = self.similarity(sim.data, self.routept_cleanup_prb)
-            np.savetxt(os.path.join(dirname, self.routept_cleanup_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'prev2next_routepts' in self.params.saved_data:
-            data = self.similarity(sim.data, self.prev2next_routepts_prb)
-            np.savetxt(os.path.join(dirname, self.prev2next_routepts_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'next_routept' in self.params.saved_data:
-            data = self.similarity(sim.data, self.next_routept_prb)
-            np.savetxt(os.path.join(dirname, self.next_routept_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'next_routept_neurons' in self.params.saved_data:
-            data = sim.data[self.next_routept_neurons_prb]
-            np.savez_compressed(
-                os.path.join(dirname, self.next_routept_neurons_filename),
-                data=np.concatenate((t, data), axis=1))
-        if 'gate_routept_cleanup' in self.params.saved_data:
-            data = sim.data[self.gate_routept_cleanup_prb]
-            np.savetxt(
-                os.path.join(dirname, self.gate_routept_cleanup_filename),
-                np.concatenate((t, data), axis=1), [t_prec, "%.6f"])
-        if 'routepts2views' in self.params.saved_data:
-            data = self.similarity(sim.data, self.routepts2views_prb)
-            np.savetxt(os.path.join(dirname, self.routepts2views_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'view7view' in self.params.saved_data:
-            data = sim.data[self.view7view_prb]
-            np.savetxt(os.path.join(dirname, self.view7view_filename),
-                       np.concatenate((t, data), axis=1), [t_prec, "%.6f"])
-        if 'routepts2norm_local_vecs' in self.params.saved_data:
-            data = sim.data[self.routepts2norm_local_vecs_prb]
-            np.savetxt(
-                os.path.join(dirname, self.routepts2norm_local_vecs_filename),
-                np.concatenate((t, data), axis=1), [t_prec, "%.6f", "%.6f"])
-        if 'gain_catch_vec' in self.params.saved_data:
-            data = sim.data[self.gain_catch_vec_prb]
-            np.savetxt(os.path.join(dirname, self.gain_catch_vec_filename),
-                       np.concatenate((t, data), axis=1), [t_prec, "%.6f"])
-        if 'gain_catch_vec_neurons' in self.params.saved_data:
-            data = sim.data[self.gain_catch_vec_neurons_prb]
-            np.savez_compressed(
-                os.path.join(dirname, self.gain_catch_vec_neurons_filename),
-                data=np.concatenate((t, data), axis=1))
-        if 'scaled_catch_vec' in self.params.saved_data:
-            data = sim.data[self.scaled_catch_vec_prb]
-            np.savetxt(os.path.join(dirname, self.scaled_catch_vec_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%.6f", "%.6f"])
-        if 'scaled_local_vec' in self.params.saved_data:
-            data = sim.data[self.scaled_local_vec_prb]
-            np.savetxt(os.path.join(dirname, self.scaled_local_vec_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%.6f", "%.6f"])
-        if 'scaled_target_vec' in self.params.saved_data:
-            data = sim.data[self.scaled_target_vec_prb]
-            np.savetxt(os.path.join(dirname, self.scaled_target_vec_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%.6f", "%.6f"])
-        if 'motion_vec' in self.params.saved_data:
-            data = sim.data[self.motion_vec_prb]
-            np.savetxt(os.path.join(dirname, self.motion_vec_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%.6f", "%.6f"])
-        if 'motion_vec_neurons' in self.params.saved_data:
-            data = sim.data[self.motion_vec_neurons_prb]
-            np.savez_compressed(
-                os.path.join(dirname, self.motion_vec_neurons_filename),
-                data=np.concatenate((t, data), axis=1))
-        if 'wheel_speeds' in self.params.saved_data:
-            data = sim.data[self.wheel_speeds_prb]
-            np.savetxt(os.path.join(dirname, self.wheel_speeds_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec, "%.6f", "%.6f"])
-        if 'gate_reset' in self.params.saved_data:
-            data = sim.data[self.gate_reset_prb]
-            np.savetxt(os.path.join(dirname, self.gate_reset_filename),
-                       np.concatenate((t, data), axis=1), [t_prec, "%.6f"])
-        if 'bg' in self.params.saved_data:
-            data = sim.data[self.bg_prb]
-            np.savetxt(os.path.join(dirname, self.bg_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'thal' in self.params.saved_data:
-            data = sim.data[self.thal_prb]
-            np.savetxt(os.path.join(dirname, self.thal_filename),
-                       np.concatenate((t, data), axis=1),
-                       [t_prec] + ["%.6f"] * data.shape[1])
-        if 'thal_neurons' in self.params.saved_data:
-            data = sim.data[self.thal_neurons_prb]
-            np.savez_compressed(
-                os.path.join(dirname, self.thal_neurons_filename),
-                data=np.concatenate((t, data), axis=1))
+        t_ranges = {}  # created on first use
+        for name in self._saved_data:
+            if name not in self._dynamic_data_specs:  # static data
+                continue
+            vrep_sampled, kind, fmt = self._dynamic_data_specs[name]
+            filename = filenames[name]
+            data = self._get_dynamic_data(sim, name)
+            if vrep_sampled not in t_ranges:
+                t_ranges[vrep_sampled] = (
+                    sim.trange(self.params.vrep_sim_dt) if vrep_sampled
+                    else sim.trange())
+            t = t_ranges[vrep_sampled]
+            if kind == 'neurons':
+                np.savez_compressed(filename, data=np.column_stack((t, data)))
+            else:
+                if fmt is None:
+                    fmt = ["%.6f"] * data.shape[1]
+                self._save_timed_data(filename, t, data, [self._t_prec] + fmt)
 
     def set_goal(self, goal_name):
         """Set current goal."""
@@ -515,25 +367,55 @@ class Model(spa.SPA):
         if goal_name not in self.scene.goals_names:
             raise ValueError("Goal '{}' is invalid.".format(goal_name))
         self._new_goal_name = goal_name
+        self._goal_pos = self.scene.goals_pos[self.scene.goal_index(goal_name)]
         self._goal_reached = False
 
+    def _get_dynamic_data(self, sim, name):
+        """Retrieve collected dynamic data in the form to be saved."""
+        prb = getattr(self, name + "_prb")
+        if name == 'vision':
+            return spa.similarity(sim.data[prb], self.views_vocab)
+        if name == 'goal_input':
+            return spa.similarity(sim.data[prb][:,1:], self.goals_vocab)
+        if self._dynamic_data_specs[name][1] == 'similarity':
+            return self.similarity(sim.data, prb)
+        return sim.data[prb]
+
+    def _save_timed_data(self, filename, t, data, fmt):
+        """Save data preceded by a column of time as text or binary file."""
+        binary_filename = os.path.splitext(filename)[0] + ".npy"
+        if self._saved_data_binary:
+            np.save(binary_filename, np.column_stack((t, data)))
+            stale_filename = filename
+        else:
+            np.savetxt(filename, np.column_stack((t, data)), fmt)
+            stale_filename = binary_filename
+
+        # Remove file of the other format possibly left by an earlier
+        # simulation saving data to the same directory (otherwise it could be
+        # loaded instead of the file that has just been saved)
+        if os.path.exists(stale_filename):
+            os.remove(stale_filename)
+
     @with_self
     def _make_model(self):
         """Create Nengo model."""
 
         # Determine normalized versions of local vectors between route
-        # waypoints
-        routes_norm_local_vecs = []
-        for route_waypts_pos in self.scene.routes_waypts_pos:
-            n_route_waypts = len(route_waypts_pos)
-            route_local_vecs = np.zeros((n_route_waypts, 2))
-            route_local_vecs[:-1] = np.diff(route_waypts_pos, axis=0)
-            route_local_vecs_norms = \
-                np.sqrt((route_local_vecs**2).sum(axis=1, keepdims=True))
-            route_norm_local_vecs = np.zeros((n_route_waypts, 2))
-            route_norm_local_vecs[:-1] = (route_local_vecs[:-1]
-                                          / route_local_vecs_norms[:-1])
-            routes_norm_local_vecs.append(route_norm_local_vecs)
+        # waypoints (for all routes at once; the last waypoint of each route
+        # has no local vector)
+        routes_waypts_pos = self.scene.all_routes_waypts_pos
+        n_routes_waypts = len(routes_waypts_pos)
+        routes_last_waypts = self.scene.routes_waypts_offsets[1:] - 1
+        routes_inner_waypts = np.ones(n_routes_waypts, dtype=bool)
+        routes_inner_waypts[routes_last_waypts] = False
+        routes_local_vecs = \
+            np.diff(routes_waypts_pos, axis=0)[routes_inner_waypts[:-1]]
+        routes_local_vecs_norms = \
+            np.linalg.norm(routes_local_vecs, axis=1, keepdims=True)
+        routes_norm_local_vecs = np.zeros((n_routes_waypts, 2))
+        routes_norm_local_vecs[routes_inner_waypts] = \
+            routes_local_vecs / routes_local_vecs_norms
 
         # Create vocabularies
         self.goals_vocab = spa.Vocabulary(
@@ -547,10 +429,13 @@ class Model(spa.SPA):
             self.params.sp_dim, max_similarity=self.params.sp_max_similarity)
         self.views_vocab.extend(views_sp_keys)
         routes_routepts_sp_keys = []
+        routes_views_sp_keys = []
+        prev_routepts_sp_keys = []
+        next_routepts_sp_keys = []
+        routepts_sp_keys = set()
         self.routepts_vocab = spa.Vocabulary(
             self.params.sp_dim, max_similarity=self.params.sp_max_similarity)
         for route_waypts_names in self.scene.routes_waypts_names:
-            route_routepts_sp_keys = []
             goal_sp_key = route_waypts_names[-1].upper()
             goal_sp = self.goals_vocab[goal_sp_key]
             prev_routept_sp = None
@@ -559,13 +444,15 @@ class Model(spa.SPA):
                 view_sp_key = "VIEW_"+route_waypt_name.upper()
                 view_sp = self.views_vocab[view_sp_key]
                 routept_sp_key = "{0}x{1}".format(goal_sp_key, view_sp_key)
-                route_routepts_sp_keys.append(routept_sp_key)
-                try:
+                routes_routepts_sp_keys.append(routept_sp_key)
+                routes_views_sp_keys.append(view_sp_key)
+                if routept_sp_key not in routepts_sp_keys:
                     self.routepts_vocab.add(routept_sp_key, goal_sp * view_sp)
-                except nengo.exceptions.ValidationError:
-                    pass  # semantic pointer already exists
+                    routepts_sp_keys.add(routept_sp_key)
                 routept_sp = self.routepts_vocab[routept_sp_key]
                 if prev_routept_sp is not None:
+                    prev_routepts_sp_keys.append(prev_routept_sp_key)
+                    next_routepts_sp_keys.append(routept_sp_key)
                     similairity = routept_sp.dot(prev_routept_sp)
                     if similairity >= self.params.sp_max_similarity:
                         warnings.warn(
@@ -574,7 +461,6 @@ class Model(spa.SPA):
                                           similairity))
                 prev_routept_sp = routept_sp
                 prev_routept_sp_key = routept_sp_key
-            routes_routepts_sp_keys.append(route_routepts_sp_keys)
 
         # If necessary, create node representing communicator for data exchange
         # with V-REP
@@ -614,25 +500,24 @@ class Model(spa.SPA):
         # Outputs (2):
         #  [0] global_vec_x
         #  [1] global_vec_y
-        self._global_vec = self.params.init_global_vec[:]  # shallow copy to
-                                                           # preserve original
-                                                           # parameter
+        self._global_vec = np.array(self.params.init_global_vec, dtype=float)
         if self.vrep_comm:
-            self._bot_prev_pos = self.scene.bot.get_position()[:2]
+            self._bot_prev_pos = np.array(self.scene.bot.get_position()[:2])
         else:
-            self._bot_prev_pos = self.params.bot_init_pos[:]  # shallow copy
+            self._bot_prev_pos = np.array(self.params.bot_init_pos,
+                                          dtype=float)
 
         def update_global_vec(t, x):
-            if not self._displaced and self._t_displace is None:
-                bot_diff_pos = [x[0] - self._bot_prev_pos[0],
-                                x[1] - self._bot_prev_pos[1]]
-                if any(bot_diff_pos):
-                    self._global_vec[0] += bot_diff_pos[0]
-                    self._global_vec[1] += bot_diff_pos[1]
-                    self._bot_prev_pos[0] += bot_diff_pos[0]
-                    self._bot_prev_pos[1] += bot_diff_pos[1]
+            if not self._displaced and t >= self._t_displace_end:
+                bot_diff_pos_x = x[0] - self._bot_prev_pos[0]
+                bot_diff_pos_y = x[1] - self._bot_prev_pos[1]
+                if bot_diff_pos_x or bot_diff_pos_y:
+                    self._global_vec[0] += bot_diff_pos_x
+                    self._global_vec[1] += bot_diff_pos_y
+                    self._bot_prev_pos[0] += bot_diff_pos_x
+                    self._bot_prev_pos[1] += bot_diff_pos_y
             else:
-                self._bot_prev_pos = x
+                self._bot_prev_pos[:] = x
             return self._global_vec
 
         self.global_vec_inp = nengo.Node(update_global_vec, size_in=2,
@@ -646,13 +531,18 @@ class Model(spa.SPA):
         # Outputs (2):
         #  [0] waypt_id
         #  [1] norm_waypt_dist
+        waypts_x = np.array(self.scene.waypts_pos[:,0], dtype=float)
+        waypts_y = np.array(self.scene.waypts_pos[:,1], dtype=float)
+        catch_area_square_radius = self.params.catch_area_radius**2
+        inv_catch_area_radius = 1.0 / self.params.catch_area_radius
+
         def update_catch_area(t, x):
-            waypts_square_dists = ((self.scene.waypts_pos - x)**2).sum(axis=1)
-            min_waypts_dist = np.sqrt(waypts_square_dists.min())
-            if min_waypts_dist < self.params.catch_area_radius:
-                norm_waypt_dist = (min_waypts_dist
-                                   / self.params.catch_area_radius)
-                return [waypts_square_dists.argmin(), norm_waypt_dist]
+            waypts_square_dists = (waypts_x - x[0])**2 + (waypts_y - x[1])**2
+            w = waypts_square_dists.argmin()
+            if waypts_square_dists[w] < catch_area_square_radius:
+                norm_waypt_dist = (math.sqrt(waypts_square_dists[w])
+                                   * inv_catch_area_radius)
+                return [w, norm_waypt_dist]
             return [-1.0, -1.0]
 
         self.catch_area_inp = nengo.Node(update_catch_area, size_in=2,
@@ -670,13 +560,21 @@ class Model(spa.SPA):
         #  [0] catch_vec_x
         #  [1] catch_vec_y
         #  [2] catch_vec_gain
+        catch_vec_thres = self.params.catch_vec_thres
+        inv_catch_vec_core_width = 1.0 / (1.0 - self.params.catch_vec_core)
+        catch_vec = np.empty(3)
+
         def update_catch_vec(t, x):
-            if x[1] > 0.0 and x[4] > self.params.catch_vec_thres:
-                catch_vec = self.scene.waypts_pos[int(x[0])] - x[2:4]
-                catch_vec_norm = np.sqrt(catch_vec**2).sum()
-                catch_vec_gain = np.minimum(
-                    (1.0 - x[1]) / (1.0 - self.params.catch_vec_core), 1.0)
-                return np.append(catch_vec / catch_vec_norm, catch_vec_gain)
+            if x[1] > 0.0 and x[4] > catch_vec_thres:
+                w = int(x[0])
+                catch_vec_x = waypts_x[w] - x[2]
+                catch_vec_y = waypts_y[w] - x[3]
+                catch_vec_norm = math.hypot(catch_vec_x, catch_vec_y)
+                catch_vec[0] = catch_vec_x / catch_vec_norm
+                catch_vec[1] = catch_vec_y / catch_vec_norm
+                catch_vec[2] = min((1.0 - x[1]) * inv_catch_vec_core_width,
+                                   1.0)
+                return catch_vec
             return [0.0, 0.0, 0.0]
 
         self.catch_vec_inp = nengo.Node(update_catch_vec, size_in=5,
@@ -692,12 +590,16 @@ class Model(spa.SPA):
         #  [1] norm_waypt_dist
         # Outputs (1):
         #  [0:sp_dim] view
+        views_vectors = np.array([self.views_vocab[view_sp_key].v
+                                  for view_sp_key in views_sp_keys])
+        no_view = np.zeros(self.params.sp_dim)
+
         def update_vision(t, x):
             if x[1] >= 0.0:
                 gain = 1.0 - 0.7 * x[1]
-                return gain * self.views_vocab[views_sp_keys[int(x[0])]].v
+                return gain * views_vectors[int(x[0])]
             else:
-                return [0.0] * self.params.sp_dim
+                return no_view
 
         self.vision_inp = nengo.Node(update_vision, size_in=2,
                                      size_out=self.params.sp_dim)
@@ -706,19 +608,14 @@ class Model(spa.SPA):
         # Create node representing displacement
         # Outputs (1):
         #  [0] displace_detected
-        self._t_displace = None
+        self._t_displace_end = float('-inf')
 
         def update_displace(t):
             if self._displaced:
-                self._t_displace = t
+                self._t_displace_end = t + 0.1
                 self._displaced = False
                 return True
-            if self._t_displace is not None:
-                if t < self._t_displace + 0.1:
-                    return True
-                else:
-                    self._t_displace = None
-            return False
+            return t < self._t_displace_end
 
         self.displace_inp = nengo.Node(update_displace, size_in=0, size_out=1)
 
@@ -728,23 +625,25 @@ class Model(spa.SPA):
         # Outputs (2):
         #  [0] goal_set
         #  [1:sp_dim+1] goal (difference between new and current)
-        self._t_new_goal = None
-        self._goal_sp = None
+        self._t_new_goal_end = float('-inf')
+        goals_sps = {"NONE": self.goals_vocab["NONE"].v}
+        goals_sps.update((goal_name, self.goals_vocab[goal_name.upper()].v)
+                         for goal_name in self.scene.goals_names)
+        new_goal_input = np.empty(1 + self.params.sp_dim)
+        new_goal_input[0] = True
+        no_goal_input = np.zeros(1 + self.params.sp_dim)
 
         def update_goal_input(t, x):
             if self._new_goal_name is not None:
                 self._goal_name = self._new_goal_name
-                self._t_new_goal = t
-                self._goal_sp = self.goals_vocab[self._goal_name.upper()].v - x
+                self._t_new_goal_end = t + 0.1
+                np.subtract(goals_sps[self._goal_name], x,
+                            out=new_goal_input[1:])
                 self._new_goal_name = None
-                return np.append([True], self._goal_sp)
-            if self._t_new_goal is not None:
-                if t < self._t_new_goal + 0.1:
-                    return np.append([True], self._goal_sp)
-                else:
-                    self._t_new_goal = None
-                    self._goal_sp = None
-            return np.append([False], [0.0] * self.params.sp_dim)
+                return new_goal_input
+            if t < self._t_new_goal_end:
+                return new_goal_input
+            return no_goal_input
 
         self.goal_input = nengo.Node(update_goal_input,
                                      size_in=self.params.sp_dim,
@@ -764,28 +663,36 @@ class Model(spa.SPA):
         #  [sp_dim:2*sp_dim] prev_routept
         # Outputs (1):
         #  [0] goal_reached
+        # Note: vectors of semantic pointers are captured here, so the
+        # vocabularies must not be extended later on (this is checked once
+        # the action selection circuit has been created)
+        goals_vectors = self.goals_vocab.vectors
+        routepts_vectors = self.routepts_vocab.vectors
+        routepts_idxs = dict(
+            (key, i) for i, key in enumerate(self.routepts_vocab.keys))
+        goals_routepts_idxs = [None] + [  # "NONE"
+            routepts_idxs.get("{0}xVIEW_{0}".format(goal_name.upper()))
+            for goal_name in self.scene.goals_names]
+        sp_dim = self.params.sp_dim
+
         def update_goal_detect(t, x):
-            sp_dim = self.params.sp_dim
-            goals_dots = spa.similarity(x[0:sp_dim], self.goals_vocab)
+            goals_dots = np.dot(goals_vectors, x[0:sp_dim])
             if goals_dots.max() < 0.45:  # insufficient similarity to any goal
                                          # (possibly no current goal set)
                 self._t_goal_reached = None
                 return self._goal_reached
-            routepts_dots = spa.similarity(x[sp_dim:2*sp_dim],
-                                           self.routepts_vocab)
+            g = goals_dots.argmax()
+            if g == 0:  # "NONE"
+                self._t_goal_reached = None
+                return self._goal_reached
+            routepts_dots = np.dot(routepts_vectors, x[sp_dim:2*sp_dim])
             if routepts_dots.max() < 0.45:  # insufficient similarity to any
                                             # routepoint (possibly no previous
                                             # routepoint reached)
                 self._t_goal_reached = None
                 return self._goal_reached
-            g = goals_dots.argmax()
-            if g == 0:  # "NONE"
-                self._t_goal_reached = None
-                return self._goal_reached
-            goal_name = self.scene.goals_names[g-1]
-            routept_sp_key = "{0}xVIEW_{0}".format(goal_name.upper())
             r = routepts_dots.argmax()
-            if self.routepts_vocab.keys[r] == routept_sp_key:
+            if r == goals_routepts_idxs[g]:
                 if self._t_goal_reached is None:
                     self._t_goal_reached = t
                 else:
@@ -831,8 +738,9 @@ class Model(spa.SPA):
 
         # Create ensemble representing normalized target vector
         def normalize_target_vec(x):
-            if any(x):
-                return x / np.sqrt((x**2).sum())
+            x_square_norm = x[0]*x[0] + x[1]*x[1]
+            if x_square_norm > 1e-20:  # guard against vanishing vectors
+                return x / math.sqrt(x_square_norm)
             else:
                 return [0.0, 0.0]
 
@@ -879,15 +787,10 @@ class Model(spa.SPA):
         nengo.Connection(self.routept_cleanup.output, self.prev_routept.input)
 
         # Create associative memory between previous and next routepoints
-        input_keys = [routept_sp_key
-                      for route_routepts_sp_keys in routes_routepts_sp_keys
-                      for routept_sp_key in route_routepts_sp_keys[:-1]]
-        output_keys = [routept_sp_key
-                       for route_routepts_sp_keys in routes_routepts_sp_keys
-                       for routept_sp_key in route_routepts_sp_keys[1:]]
         self.prev2next_routepts = spa.AssociativeMemory(
             input_vocab=self.routepts_vocab, output_vocab=self.routepts_vocab,
-            input_keys=input_keys, output_keys=output_keys, wta_output=True)
+            input_keys=prev_routepts_sp_keys,
+            output_keys=next_routepts_sp_keys, wta_output=True)
         nengo.Connection(self.prev_routept.output,
                          self.prev2next_routepts.input)
 
@@ -928,15 +831,10 @@ class Model(spa.SPA):
                          self.routept_cleanup.inhibit, transform=6.0)
 
         # Create associative memory between routepoints and views
-        input_keys = [routept_sp_key
-                      for route_routepts_sp_keys in routes_routepts_sp_keys
-                      for routept_sp_key in route_routepts_sp_keys]
-        output_keys = ["VIEW_"+route_waypt_name.upper()
-                       for route_waypts_names in self.scene.routes_waypts_names
-                       for route_waypt_name in route_waypts_names]
         self.routepts2views = spa.AssociativeMemory(
             input_vocab=self.routepts_vocab, output_vocab=self.views_vocab,
-            input_keys=input_keys, output_keys=output_keys, wta_output=True)
+            input_keys=routes_routepts_sp_keys,
+            output_keys=routes_views_sp_keys, wta_output=True)
         nengo.Connection(self.prev2next_routepts.output,
                          self.routepts2views.input)
         nengo.Connection(self.view_routept.output, self.routepts2views.input)
@@ -952,9 +850,8 @@ class Model(spa.SPA):
         # Create associative memory between routepoints and normalized local
         # vectors between route waypoints
         input_vectors = [self.routepts_vocab[routept_sp_key].v
-                         for route_routepts_sp_keys in routes_routepts_sp_keys
-                         for routept_sp_key in route_routepts_sp_keys]
-        output_vectors = np.concatenate(routes_norm_local_vecs)
+                         for routept_sp_key in routes_routepts_sp_keys]
+        output_vectors = routes_norm_local_vecs
         self.routepts2norm_local_vecs = networks.AssociativeMemory(
             input_vectors=input_vectors, output_vectors=output_vectors)
         self.routepts2norm_local_vecs.add_wta_network(inhibit_scale=3.0)
@@ -1004,7 +901,7 @@ class Model(spa.SPA):
             transform=[[1.0, 0.0], [0.0, 1.0], [1.0, 0.0], [0.0, 1.0]])
         nengo.Connection(
             self.bot_orient_inp, self.motion_vec_aggreg.B,
-            function=lambda x: (np.cos(x), np.sin(x)),
+            function=lambda x: (math.cos(x[0]), math.sin(x[0])),
             transform=[[1.0, 0.0], [0.0, 1.0], [0.0, -1.0], [1.0, 0.0]])
 
         # Create ensemble representing motion vector
@@ -1021,9 +918,9 @@ class Model(spa.SPA):
         #  [0] left_wheel_speed
         #  [1] right_wheel_speed
         def update_wheel_speeds(t, x):
-            if np.sqrt((x**2).sum()) < 0.05:
+            if math.hypot(x[0], x[1]) < 0.05:
                 return [0.0, 0.0]  # stop
-            theta = np.arctan2(x[1], x[0])
+            theta = math.atan2(x[1], x[0])
             if -0.4 < theta < 0.4:
                 return [5.0-theta, 5.0+theta]  # (curvilinear) motion forward
             else:
@@ -1069,137 +966,144 @@ class Model(spa.SPA):
         self.bg = spa.BasalGanglia(actions)
         self.thal = spa.Thalamus(self.bg)
 
+        # Ensure that vocabularies used by goal detection have not been
+        # extended since their vectors were captured
+        if (self.goals_vocab.vectors is not goals_vectors
+            or self.routepts_vocab.vectors is not routepts_vectors):
+            raise RuntimeError(
+                "Vocabularies were extended after goal detection was created.")
+
     @with_self
     def _make_probes(self):
         """Create probes for recording dynamic data."""
 
-        if 'bot_pos' in self.params.saved_data:
+        if 'bot_pos' in self._saved_data:
             self.bot_pos_prb = nengo.Probe(
                 self.bot_pos_inp, sample_every=self.params.vrep_sim_dt)
-        if 'bot_orient' in self.params.saved_data:
+        if 'bot_orient' in self._saved_data:
             self.bot_orient_prb = nengo.Probe(
                 self.bot_orient_inp, sample_every=self.params.vrep_sim_dt)
-        if 'global_vec' in self.params.saved_data:
+        if 'global_vec' in self._saved_data:
             self.global_vec_prb = nengo.Probe(
                 self.global_vec_inp, sample_every=self.params.vrep_sim_dt)
-        if 'catch_area' in self.params.saved_data:
+        if 'catch_area' in self._saved_data:
             self.catch_area_prb = nengo.Probe(
                 self.catch_area_inp, sample_every=self.params.vrep_sim_dt)
-        if 'catch_vec' in self.params.saved_data:
+        if 'catch_vec' in self._saved_data:
             self.catch_vec_prb = nengo.Probe(
                 self.catch_vec_inp, sample_every=self.params.vrep_sim_dt)
-        if 'vision' in self.params.saved_data:
+        if 'vision' in self._saved_data:
             self.vision_prb = nengo.Probe(self.vision_inp,
                                           sample_every=self.params.vrep_sim_dt)
-        if 'displace' in self.params.saved_data:
+        if 'displace' in self._saved_data:
             self.displace_prb = nengo.Probe(self.displace_inp)
-        if 'goal_input' in self.params.saved_data:
+        if 'goal_input' in self._saved_data:
             self.goal_input_prb = nengo.Probe(self.goal_input)
-        if 'goal' in self.params.saved_data:
+        if 'goal' in self._saved_data:
             self.goal_prb = nengo.Probe(self.goal.output,
                                         synapse=self.params.prb_syn)
-        if 'goal_neurons' in self.params.saved_data:
+        if 'goal_neurons' in self._saved_data:
             self.goal_neurons_prb = nengo.Probe(
                 self.goal.state_ensembles.add_neuron_output())
-        if 'goal_detect' in self.params.saved_data:
+        if 'goal_detect' in self._saved_data:
             self.goal_detect_prb = nengo.Probe(self.goal_detect_inp)
-        if 'goals2goals_vecs' in self.params.saved_data:
+        if 'goals2goals_vecs' in self._saved_data:
             self.goals2goals_vecs_prb = nengo.Probe(
                 self.goals2goals_vecs.output, synapse=self.params.prb_syn)
-        if 'target_vec' in self.params.saved_data:
+        if 'target_vec' in self._saved_data:
             self.target_vec_prb = nengo.Probe(self.target_vec,
                                               synapse=self.params.prb_syn)
-        if 'target_vec_neurons' in self.params.saved_data:
+        if 'target_vec_neurons' in self._saved_data:
             self.target_vec_neurons_prb = nengo.Probe(self.target_vec.neurons)
-        if 'gate_target_vec' in self.params.saved_data:
+        if 'gate_target_vec' in self._saved_data:
             self.gate_target_vec_prb = nengo.Probe(self.gate_target_vec.output,
                                                    synapse=self.params.prb_syn)
-        if 'gate_target_vec_goal' in self.params.saved_data:
+        if 'gate_target_vec_goal' in self._saved_data:
             self.gate_target_vec_goal_prb = nengo.Probe(
                 self.gate_target_vec_goal.output, synapse=self.params.prb_syn)
-        if 'norm_target_vec' in self.params.saved_data:
+        if 'norm_target_vec' in self._saved_data:
             self.norm_target_vec_prb = nengo.Probe(self.norm_target_vec,
                                                    synapse=self.params.prb_syn)
-        if 'view' in self.params.saved_data:
+        if 'view' in self._saved_data:
             self.view_prb = nengo.Probe(self.view.output,
                                         synapse=self.params.prb_syn)
-        if 'view_neurons' in self.params.saved_data:
+        if 'view_neurons' in self._saved_data:
             self.view_neurons_prb = nengo.Probe(
                 self.view.state_ensembles.add_neuron_output())
-        if 'goal0view' in self.params.saved_data:
+        if 'goal0view' in self._saved_data:
             self.goal0view_prb = nengo.Probe(self.goal0view.output,
                                              synapse=self.params.prb_syn)
-        if 'view_routept' in self.params.saved_data:
+        if 'view_routept' in self._saved_data:
             self.view_routept_prb = nengo.Probe(self.view_routept.output,
                                                 synapse=self.params.prb_syn)
-        if 'view_routept_neurons' in self.params.saved_data:
+        if 'view_routept_neurons' in self._saved_data:
             self.view_routept_neurons_prb = nengo.Probe(
                 self.view_routept.state_ensembles.add_neuron_output())
-        if 'gate_view_routept' in self.params.saved_data:
+        if 'gate_view_routept' in self._saved_data:
             self.gate_view_routept_prb = nengo.Probe(
                 self.gate_view_routept.output, synapse=self.params.prb_syn)
-        if 'prev_routept' in self.params.saved_data:
+        if 'prev_routept' in self._saved_data:
             self.prev_routept_prb = nengo.Probe(self.prev_routept.output,
                                                 synapse=self.params.prb_syn)
-        if 'prev_routept_neurons' in self.params.saved_data:
+        if 'prev_routept_neurons' in self._saved_data:
             self.prev_routept_neurons_prb = nengo.Probe(
                 self.prev_routept.state_ensembles.add_neuron_output())
-        if 'routept_cleanup' in self.params.saved_data:
+        if 'routept_cleanup' in self._saved_data:
             self.routept_cleanup_prb = nengo.Probe(self.routept_cleanup.output,
                                                    synapse=self.params.prb_syn)
-        if 'prev2next_routepts' in self.params.saved_data:
+        if 'prev2next_routepts' in self._saved_data:
             self.prev2next_routepts_prb = nengo.Probe(
                 self.prev2next_routepts.output, synapse=self.params.prb_syn)
-        if 'next_routept' in self.params.saved_data:
+        if 'next_routept' in self._saved_data:
             self.next_routept_prb = nengo.Probe(self.next_routept.output,
                                                 synapse=self.params.prb_syn)
-        if 'next_routept_neurons' in self.params.saved_data:
+        if 'next_routept_neurons' in self._saved_data:
             self.next_routept_neurons_prb = nengo.Probe(
                 self.next_routept.state_ensembles.add_neuron_output())
-        if 'gate_routept_cleanup' in self.params.saved_data:
+        if 'gate_routept_cleanup' in self._saved_data:
             self.gate_routept_cleanup_prb = nengo.Probe(
                 self.gate_routept_cleanup.output, synapse=self.params.prb_syn)
-        if 'routepts2views' in self.params.saved_data:
+        if 'routepts2views' in self._saved_data:
             self.routepts2views_prb = nengo.Probe(self.routepts2views.output,
                                                   synapse=self.params.prb_syn)
-        if 'view7view' in self.params.saved_data:
+        if 'view7view' in self._saved_data:
             self.view7view_prb = nengo.Probe(self.view7view.output,
                                              synapse=self.params.prb_syn)
-        if 'routepts2norm_local_vecs' in self.params.saved_data:
+        if 'routepts2norm_local_vecs' in self._saved_data:
             self.routepts2norm_local_vecs_prb = nengo.Probe(
                 self.routepts2norm_local_vecs.output,
                 synapse=self.params.prb_syn)
-        if 'gain_catch_vec' in self.params.saved_data:
+        if 'gain_catch_vec' in self._saved_data:
             self.gain_catch_vec_prb = nengo.Probe(self.gain_catch_vec,
                                                   synapse=self.params.prb_syn)
-        if 'gain_catch_vec_neurons' in self.params.saved_data:
+        if 'gain_catch_vec_neurons' in self._saved_data:
             self.gain_catch_vec_neurons_prb = nengo.Probe(
                 self.gain_catch_vec.neurons)
-        if 'scaled_catch_vec' in self.params.saved_data:
+        if 'scaled_catch_vec' in self._saved_data:
             self.scaled_catch_vec_prb = nengo.Probe(
                 self.scaled_catch_vec.output, synapse=self.params.prb_syn)
-        if 'scaled_local_vec' in self.params.saved_data:
+        if 'scaled_local_vec' in self._saved_data:
             self.scaled_local_vec_prb = nengo.Probe(
                 self.scaled_local_vec.output, synapse=self.params.prb_syn)
-        if 'scaled_target_vec' in self.params.saved_data:
+        if 'scaled_target_vec' in self._saved_data:
             self.scaled_target_vec_prb = nengo.Probe(
                 self.scaled_target_vec.output, synapse=self.params.prb_syn)
-        if 'motion_vec' in self.params.saved_data:
+        if 'motion_vec' in self._saved_data:
             self.motion_vec_prb = nengo.Probe(self.motion_vec,
                                               synapse=self.params.prb_syn)
-        if 'motion_vec_neurons' in self.params.saved_data:
+        if 'motion_vec_neurons' in self._saved_data:
             self.motion_vec_neurons_prb = nengo.Probe(self.motion_vec.neurons)
-        if 'wheel_speeds' in self.params.saved_data:
+        if 'wheel_speeds' in self._saved_data:
             self.wheel_speeds_prb = nengo.Probe(self.wheel_speeds)
-        if 'gate_reset' in self.params.saved_data:
+        if 'gate_reset' in self._saved_data:
             self.gate_reset_prb = nengo.Probe(self.gate_reset.output,
                                               synapse=self.params.prb_syn)
-        if 'bg' in self.params.saved_data:
+        if 'bg' in self._saved_data:
             self.bg_prb = nengo.Probe(self.bg.input,
                                       synapse=self.params.prb_syn)
-        if 'thal' in self.params.saved_data:
+        if 'thal' in self._saved_data:
             self.thal_prb = nengo.Probe(self.thal.actions.output,
                                         synapse=self.params.prb_syn)
-        if 'thal_neurons' in self.params.saved_data:
+        if 'thal_neurons' in self._saved_data:
             self.thal_neurons_prb = nengo.Probe(
                 self.thal.actions.add_neuron_output())
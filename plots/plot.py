@@ -1,4 +1,5 @@
 import argparse
+import collections
 import os
 
 import matplotlib.pyplot as plt
@@ -10,6 +11,36 @@ params = {
     'plot_bot_pos_aerial.yticks': np.arange(0.0, 8.1, 1.0)
     }
 
+_data_cache = {}
+
+
+def load_data(data_path, filename, t_limits=None):
+    """Load data from file (binary version if available), optionally only
+       within time limits."""
+    key = (data_path, filename)
+    if key not in _data_cache:
+        binary_path = os.path.join(
+            data_path, os.path.splitext(filename)[0] + ".npy")
+        if os.path.exists(binary_path):
+            _data_cache[key] = np.load(binary_path, mmap_mode='r')
+        else:
+            _data_cache[key] = np.loadtxt(os.path.join(data_path, filename))
+    data = _data_cache[key]
+    if t_limits is not None:
+        # keep one sample beyond each limit so that lines reach plot edges
+        start, end = np.searchsorted(data[:,0], t_limits)
+        data = data[max(start - 1, 0):end + 1]
+    return data
+
+
+def load_names(data_path, filename):
+    """Load names (one per line) from file."""
+    key = (data_path, filename)
+    if key not in _data_cache:
+        with open(os.path.join(data_path, filename)) as f:
+            _data_cache[key] = [line.strip() for line in f if line.strip()]
+    return _data_cache[key]
+
 
 def plot_action_names(data_path, params):
     """Plot basal ganglia."""
@@ -17,9 +48,8 @@ def plot_action_names(data_path, params):
 
     t_limits = params['t_limits']
 
-    action_names = np.loadtxt(os.path.join(data_path, "actionname.txt"),
-                              dtype=str)
-    bg = np.loadtxt(os.path.join(data_path, "bg.txt"))
+    action_names = load_names(data_path, "actionname.txt")
+    bg = load_data(data_path, "bg.txt", t_limits)
 
     plt.plot(bg[:,0], bg[:,1:])
     if t_limits is not None:
@@ -38,8 +68,8 @@ def plot_bot_orient(data_path, params):
 
     t_limits = params['t_limits']
 
-    bot_orient = np.loadtxt(os.path.join(data_path, "botorient.txt"))
-    bot_orient_deg = bot_orient[:,1] * (180.0 / np.pi)
+    bot_orient = load_data(data_path, "botorient.txt", t_limits)
+    bot_orient_deg = np.rad2deg(bot_orient[:,1])
 
     plt.plot(bot_orient[:,0], bot_orient_deg)
     if t_limits is not None:
@@ -57,15 +87,14 @@ def plot_bot_pos(data_path, params):
 
     t_limits = params['t_limits']
 
-    bot_pos = np.loadtxt(os.path.join(data_path, "botpos.txt"))
+    bot_pos = load_data(data_path, "botpos.txt", t_limits)
 
-    plt.plot(bot_pos[:,0], bot_pos[:,1], label="x")
-    plt.plot(bot_pos[:,0], bot_pos[:,2], label="y")
+    plt.plot(bot_pos[:,0], bot_pos[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Position (m)")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["x", "y"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("bot_pos")
 
 
@@ -76,16 +105,17 @@ def plot_bot_pos_aerial(data_path, params):
     axis = params['plot_bot_pos_aerial.axis']
     yticks = params['plot_bot_pos_aerial.yticks']
 
-    bot_pos = np.loadtxt(os.path.join(data_path, "botpos.txt"))
-    routes_waypts_pos = np.loadtxt(os.path.join(data_path,
-                                                "routewayptpos.txt"))
-    waypts_pos = np.loadtxt(os.path.join(data_path, "wayptpos.txt"))
-
-    for route_id in range(1, int(routes_waypts_pos[:,0].max()) + 1):
-        route_idxs = np.where(routes_waypts_pos[:,0] == route_id)[0]
-        plt.plot(routes_waypts_pos[route_idxs,1],
-                 routes_waypts_pos[route_idxs,2], ':', linewidth=1.0,
-                 color='gray')
+    bot_pos = load_data(data_path, "botpos.txt")
+    routes_waypts_pos = load_data(data_path, "routewayptpos.txt")
+    waypts_pos = load_data(data_path, "wayptpos.txt")
+
+    routes_waypts_pos = routes_waypts_pos[
+        np.argsort(routes_waypts_pos[:,0], kind='mergesort')]
+    routes_starts = np.unique(routes_waypts_pos[:,0], return_index=True)[1]
+    for route_waypts_pos in np.split(routes_waypts_pos[:,1:3],
+                                     routes_starts[1:]):
+        plt.plot(route_waypts_pos[:,0], route_waypts_pos[:,1], ':',
+                 linewidth=1.0, color='gray')
     plt.plot(bot_pos[:,1], bot_pos[:,2], '-', linewidth=1.5,
              color='midnightblue')
     plt.plot(waypts_pos[:,0], waypts_pos[:,1], 'o', markersize=5,
@@ -106,9 +136,8 @@ def plot_catch_area(data_path, params):
 
     t_limits = params['t_limits']
 
-    catch_area = np.loadtxt(os.path.join(data_path, "catcharea.txt"))
-    waypts_names = np.loadtxt(os.path.join(data_path, "wayptname.txt"),
-                              dtype=str)
+    catch_area = load_data(data_path, "catcharea.txt", t_limits)
+    waypts_names = load_names(data_path, "wayptname.txt")
     n_waypts = len(waypts_names)
 
     print("Waypoint id (catch_area):")
@@ -130,7 +159,7 @@ def plot_catch_area_norm(data_path, params):
 
     t_limits = params['t_limits']
 
-    catch_area = np.loadtxt(os.path.join(data_path, "catcharea.txt"))
+    catch_area = load_data(data_path, "catcharea.txt", t_limits)
 
     plt.plot(catch_area[:,0], catch_area[:,2])
     if t_limits is not None:
@@ -147,15 +176,14 @@ def plot_catch_vec(data_path, params):
 
     t_limits = params['t_limits']
 
-    catch_vec = np.loadtxt(os.path.join(data_path, "catchvec.txt"))
+    catch_vec = load_data(data_path, "catchvec.txt", t_limits)
 
-    plt.plot(catch_vec[:,0], catch_vec[:,1], label="x")
-    plt.plot(catch_vec[:,0], catch_vec[:,2], label="y")
+    plt.plot(catch_vec[:,0], catch_vec[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Component (m)")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["x", "y"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("catch_vec")
 
 
@@ -165,7 +193,7 @@ def plot_displace(data_path, params):
 
     t_limits = params['t_limits']
 
-    displace = np.loadtxt(os.path.join(data_path, "displace.txt"))
+    displace = load_data(data_path, "displace.txt", t_limits)
 
     plt.plot(displace[:,0], displace[:,1])
     if t_limits is not None:
@@ -182,7 +210,7 @@ def plot_gain_catch_vec(data_path, params):
 
     t_limits = params['t_limits']
 
-    gain_catch_vec = np.loadtxt(os.path.join(data_path, "gaincatchvec.txt"))
+    gain_catch_vec = load_data(data_path, "gaincatchvec.txt", t_limits)
 
     plt.plot(gain_catch_vec[:,0], gain_catch_vec[:,1])
     if t_limits is not None:
@@ -199,7 +227,7 @@ def plot_gate_reset(data_path, params):
 
     t_limits = params['t_limits']
 
-    gate_reset = np.loadtxt(os.path.join(data_path, "gatereset.txt"))
+    gate_reset = load_data(data_path, "gatereset.txt", t_limits)
 
     plt.plot(gate_reset[:,0], gate_reset[:,1])
     if t_limits is not None:
@@ -215,8 +243,8 @@ def plot_gate_routept_cleanup(data_path, params):
 
     t_limits = params['t_limits']
 
-    gate_routept_cleanup = np.loadtxt(os.path.join(data_path,
-                                                   "gaterouteptcleanup.txt"))
+    gate_routept_cleanup = load_data(data_path, "gaterouteptcleanup.txt",
+                                     t_limits)
 
     plt.plot(gate_routept_cleanup[:,0], gate_routept_cleanup[:,1])
     if t_limits is not None:
@@ -232,7 +260,7 @@ def plot_gate_target_vec(data_path, params):
 
     t_limits = params['t_limits']
 
-    gate_target_vec = np.loadtxt(os.path.join(data_path, "gatetargetvec.txt"))
+    gate_target_vec = load_data(data_path, "gatetargetvec.txt", t_limits)
 
     plt.plot(gate_target_vec[:,0], gate_target_vec[:,1])
     if t_limits is not None:
@@ -249,8 +277,8 @@ def plot_gate_target_vec_goal(data_path, params):
 
     t_limits = params['t_limits']
 
-    gate_target_vec_goal = np.loadtxt(os.path.join(data_path,
-                                                   "gatetargetvecgoal.txt"))
+    gate_target_vec_goal = load_data(data_path, "gatetargetvecgoal.txt",
+                                     t_limits)
 
     plt.plot(gate_target_vec_goal[:,0], gate_target_vec_goal[:,1])
     if t_limits is not None:
@@ -267,8 +295,7 @@ def plot_gate_view_routept(data_path, params):
 
     t_limits = params['t_limits']
 
-    gate_view_routept = np.loadtxt(os.path.join(data_path,
-                                                "gateviewroutept.txt"))
+    gate_view_routept = load_data(data_path, "gateviewroutept.txt", t_limits)
 
     plt.plot(gate_view_routept[:,0], gate_view_routept[:,1])
     if t_limits is not None:
@@ -284,15 +311,14 @@ def plot_global_vec(data_path, params):
 
     t_limits = params['t_limits']
 
-    global_vec = np.loadtxt(os.path.join(data_path, "globalvec.txt"))
+    global_vec = load_data(data_path, "globalvec.txt", t_limits)
 
-    plt.plot(global_vec[:,0], global_vec[:,1], label="x")
-    plt.plot(global_vec[:,0], global_vec[:,2], label="y")
+    plt.plot(global_vec[:,0], global_vec[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Position (m)")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["x", "y"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("global_vec")
 
 
@@ -302,9 +328,8 @@ def plot_goal(data_path, params):
 
     t_limits = params['t_limits']
 
-    goal = np.loadtxt(os.path.join(data_path, "goal.txt"))
-    goals_vocab = np.loadtxt(os.path.join(data_path, "goalvocab.txt"),
-                             dtype=str)
+    goal = load_data(data_path, "goal.txt", t_limits)
+    goals_vocab = load_names(data_path, "goalvocab.txt")
 
     plt.plot(goal[:,0], goal[:,1:])
     if t_limits is not None:
@@ -323,9 +348,8 @@ def plot_goal0view(data_path, params):
 
     t_limits = params['t_limits']
 
-    goal0view = np.loadtxt(os.path.join(data_path, "goal0view.txt"))
-    routepts_vocab = np.loadtxt(os.path.join(data_path, "routeptvocab.txt"),
-                                dtype=str)
+    goal0view = load_data(data_path, "goal0view.txt", t_limits)
+    routepts_vocab = load_names(data_path, "routeptvocab.txt")
 
     plt.plot(goal0view[:,0], goal0view[:,1:])
     if t_limits is not None:
@@ -344,7 +368,7 @@ def plot_goal_detect(data_path, params):
 
     t_limits = params['t_limits']
 
-    goal_detect = np.loadtxt(os.path.join(data_path, "goaldetect.txt"))
+    goal_detect = load_data(data_path, "goaldetect.txt", t_limits)
 
     plt.plot(goal_detect[:,0], goal_detect[:,1:])
     if t_limits is not None:
@@ -361,9 +385,8 @@ def plot_goal_input(data_path, params):
 
     t_limits = params['t_limits']
 
-    goal_input = np.loadtxt(os.path.join(data_path, "goalinput.txt"))
-    goals_vocab = np.loadtxt(os.path.join(data_path, "goalvocab.txt"),
-                             dtype=str)
+    goal_input = load_data(data_path, "goalinput.txt", t_limits)
+    goals_vocab = load_names(data_path, "goalvocab.txt")
 
     plt.plot(goal_input[:,0], goal_input[:,1:])
     if t_limits is not None:
@@ -382,15 +405,14 @@ def plot_goals2goals_vecs(data_path, params):
 
     t_limits = params['t_limits']
 
-    goals2goals_vecs = np.loadtxt(os.path.join(data_path, "goal2goalvec.txt"))
+    goals2goals_vecs = load_data(data_path, "goal2goalvec.txt", t_limits)
 
-    plt.plot(goals2goals_vecs[:,0], goals2goals_vecs[:,1], label="x")
-    plt.plot(goals2goals_vecs[:,0], goals2goals_vecs[:,2], label="y")
+    plt.plot(goals2goals_vecs[:,0], goals2goals_vecs[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Position (m)")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["x", "y"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("goals2goals_vecs")
 
 
@@ -400,15 +422,14 @@ def plot_motion_vec(data_path, params):
 
     t_limits = params['t_limits']
 
-    motion_vec = np.loadtxt(os.path.join(data_path, "motionvec.txt"))
+    motion_vec = load_data(data_path, "motionvec.txt", t_limits)
 
-    plt.plot(motion_vec[:,0], motion_vec[:,1], label="x")
-    plt.plot(motion_vec[:,0], motion_vec[:,2], label="y")
+    plt.plot(motion_vec[:,0], motion_vec[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Component (m)")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["x", "y"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("motion_vec")
 
 
@@ -418,9 +439,8 @@ def plot_next_routept(data_path, params):
 
     t_limits = params['t_limits']
 
-    next_routept = np.loadtxt(os.path.join(data_path, "nextroutept.txt"))
-    routepts_vocab = np.loadtxt(os.path.join(data_path, "routeptvocab.txt"),
-                                dtype=str)
+    next_routept = load_data(data_path, "nextroutept.txt", t_limits)
+    routepts_vocab = load_names(data_path, "routeptvocab.txt")
 
     plt.plot(next_routept[:,0], next_routept[:,1:])
     if t_limits is not None:
@@ -439,15 +459,14 @@ def plot_norm_target_vec(data_path, params):
 
     t_limits = params['t_limits']
 
-    norm_target_vec = np.loadtxt(os.path.join(data_path, "normtargetvec.txt"))
+    norm_target_vec = load_data(data_path, "normtargetvec.txt", t_limits)
 
-    plt.plot(norm_target_vec[:,0], norm_target_vec[:,1], label="x")
-    plt.plot(norm_target_vec[:,0], norm_target_vec[:,2], label="y")
+    plt.plot(norm_target_vec[:,0], norm_target_vec[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Component (m)")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["x", "y"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("norm_target_vec")
 
 
@@ -457,10 +476,8 @@ def plot_prev2next_routepts(data_path, params):
 
     t_limits = params['t_limits']
 
-    prev2next_routepts = np.loadtxt(os.path.join(data_path,
-                                                 "prev2nextroutept.txt"))
-    routepts_vocab = np.loadtxt(os.path.join(data_path, "routeptvocab.txt"),
-                                dtype=str)
+    prev2next_routepts = load_data(data_path, "prev2nextroutept.txt", t_limits)
+    routepts_vocab = load_names(data_path, "routeptvocab.txt")
 
     plt.plot(prev2next_routepts[:,0], prev2next_routepts[:,1:])
     if t_limits is not None:
@@ -479,9 +496,8 @@ def plot_prev_routept(data_path, params):
 
     t_limits = params['t_limits']
 
-    prev_routept = np.loadtxt(os.path.join(data_path, "prevroutept.txt"))
-    routepts_vocab = np.loadtxt(os.path.join(data_path, "routeptvocab.txt"),
-                                dtype=str)
+    prev_routept = load_data(data_path, "prevroutept.txt", t_limits)
+    routepts_vocab = load_names(data_path, "routeptvocab.txt")
 
     plt.plot(prev_routept[:,0], prev_routept[:,1:])
     if t_limits is not None:
@@ -500,9 +516,8 @@ def plot_routept_cleanup(data_path, params):
 
     t_limits = params['t_limits']
 
-    routept_cleanup = np.loadtxt(os.path.join(data_path, "routeptcleanup.txt"))
-    routepts_vocab = np.loadtxt(os.path.join(data_path, "routeptvocab.txt"),
-                                dtype=str)
+    routept_cleanup = load_data(data_path, "routeptcleanup.txt", t_limits)
+    routepts_vocab = load_names(data_path, "routeptvocab.txt")
 
     plt.plot(routept_cleanup[:,0], routept_cleanup[:,1:])
     if t_limits is not None:
@@ -522,18 +537,15 @@ def plot_routepts2norm_local_vecs(data_path, params):
 
     t_limits = params['t_limits']
 
-    routepts2norm_local_vecs = np.loadtxt(
-        os.path.join(data_path, "routept2normlocalvec.txt"))
+    routepts2norm_local_vecs = load_data(data_path, "routept2normlocalvec.txt",
+                                         t_limits)
 
-    plt.plot(routepts2norm_local_vecs[:,0], routepts2norm_local_vecs[:,1],
-             label="x")
-    plt.plot(routepts2norm_local_vecs[:,0], routepts2norm_local_vecs[:,2],
-             label="y")
+    plt.plot(routepts2norm_local_vecs[:,0], routepts2norm_local_vecs[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Component (m)")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["x", "y"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("routepts2norm_local_vecs")
 
 
@@ -543,9 +555,8 @@ def plot_routepts2views(data_path, params):
 
     t_limits = params['t_limits']
 
-    routepts2views = np.loadtxt(os.path.join(data_path, "routept2view.txt"))
-    views_vocab = np.loadtxt(os.path.join(data_path, "viewvocab.txt"),
-                             dtype=str)
+    routepts2views = load_data(data_path, "routept2view.txt", t_limits)
+    views_vocab = load_names(data_path, "viewvocab.txt")
 
     plt.plot(routepts2views[:,0], routepts2views[:,1:])
     if t_limits is not None:
@@ -564,16 +575,14 @@ def plot_scaled_catch_vec(data_path, params):
 
     t_limits = params['t_limits']
 
-    scaled_catch_vec = np.loadtxt(os.path.join(data_path,
-                                               "scaledcatchvec.txt"))
+    scaled_catch_vec = load_data(data_path, "scaledcatchvec.txt", t_limits)
 
-    plt.plot(scaled_catch_vec[:,0], scaled_catch_vec[:,1], label="x")
-    plt.plot(scaled_catch_vec[:,0], scaled_catch_vec[:,2], label="y")
+    plt.plot(scaled_catch_vec[:,0], scaled_catch_vec[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Component (m)")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["x", "y"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("scaled_catch_vec")
 
 
@@ -583,16 +592,14 @@ def plot_scaled_local_vec(data_path, params):
 
     t_limits = params['t_limits']
 
-    scaled_local_vec = np.loadtxt(os.path.join(data_path,
-                                               "scaledlocalvec.txt"))
+    scaled_local_vec = load_data(data_path, "scaledlocalvec.txt", t_limits)
 
-    plt.plot(scaled_local_vec[:,0], scaled_local_vec[:,1], label="x")
-    plt.plot(scaled_local_vec[:,0], scaled_local_vec[:,2], label="y")
+    plt.plot(scaled_local_vec[:,0], scaled_local_vec[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Component (m)")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["x", "y"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("scaled_local_vec")
 
 
@@ -602,16 +609,14 @@ def plot_scaled_target_vec(data_path, params):
 
     t_limits = params['t_limits']
 
-    scaled_target_vec = np.loadtxt(os.path.join(data_path,
-                                                "scaledtargetvec.txt"))
+    scaled_target_vec = load_data(data_path, "scaledtargetvec.txt", t_limits)
 
-    plt.plot(scaled_target_vec[:,0], scaled_target_vec[:,1], label="x")
-    plt.plot(scaled_target_vec[:,0], scaled_target_vec[:,2], label="y")
+    plt.plot(scaled_target_vec[:,0], scaled_target_vec[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Component (m)")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["x", "y"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("scaled_target_vec")
 
 
@@ -621,15 +626,14 @@ def plot_target_vec(data_path, params):
 
     t_limits = params['t_limits']
 
-    target_vec = np.loadtxt(os.path.join(data_path, "targetvec.txt"))
+    target_vec = load_data(data_path, "targetvec.txt", t_limits)
 
-    plt.plot(target_vec[:,0], target_vec[:,1], label="x")
-    plt.plot(target_vec[:,0], target_vec[:,2], label="y")
+    plt.plot(target_vec[:,0], target_vec[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Component (m)")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["x", "y"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("target_vec")
 
 
@@ -639,9 +643,8 @@ def plot_thal(data_path, params):
 
     t_limits = params['t_limits']
 
-    action_names = np.loadtxt(os.path.join(data_path, "actionname.txt"),
-                              dtype=str)
-    thal = np.loadtxt(os.path.join(data_path, "thal.txt"))
+    action_names = load_names(data_path, "actionname.txt")
+    thal = load_data(data_path, "thal.txt", t_limits)
 
     plt.plot(thal[:,0], thal[:,1:])
     if t_limits is not None:
@@ -660,9 +663,8 @@ def plot_view(data_path, params):
 
     t_limits = params['t_limits']
 
-    view = np.loadtxt(os.path.join(data_path, "view.txt"))
-    views_vocab = np.loadtxt(os.path.join(data_path, "viewvocab.txt"),
-                             dtype=str)
+    view = load_data(data_path, "view.txt", t_limits)
+    views_vocab = load_names(data_path, "viewvocab.txt")
 
     plt.plot(view[:,0], view[:,1:])
     if t_limits is not None:
@@ -681,7 +683,7 @@ def plot_view7view(data_path, params):
 
     t_limits = params['t_limits']
 
-    view7view = np.loadtxt(os.path.join(data_path, "view7view.txt"))
+    view7view = load_data(data_path, "view7view.txt", t_limits)
 
     plt.plot(view7view[:,0], view7view[:,1:])
     if t_limits is not None:
@@ -697,9 +699,8 @@ def plot_view_routept(data_path, params):
 
     t_limits = params['t_limits']
 
-    routepts_vocab = np.loadtxt(os.path.join(data_path, "routeptvocab.txt"),
-                                dtype=str)
-    view_routept = np.loadtxt(os.path.join(data_path, "viewroutept.txt"))
+    routepts_vocab = load_names(data_path, "routeptvocab.txt")
+    view_routept = load_data(data_path, "viewroutept.txt", t_limits)
 
     plt.plot(view_routept[:,0], view_routept[:,1:])
     if t_limits is not None:
@@ -718,9 +719,8 @@ def plot_vision(data_path, params):
 
     t_limits = params['t_limits']
 
-    views_vocab = np.loadtxt(os.path.join(data_path, "viewvocab.txt"),
-                             dtype=str)
-    vision = np.loadtxt(os.path.join(data_path, "vision.txt"))
+    views_vocab = load_names(data_path, "viewvocab.txt")
+    vision = load_data(data_path, "vision.txt", t_limits)
 
     plt.plot(vision[:,0], vision[:,1:])
     if t_limits is not None:
@@ -739,19 +739,61 @@ def plot_wheel_speeds(data_path, params):
 
     t_limits = params['t_limits']
 
-    wheel_speeds = np.loadtxt(os.path.join(data_path, "wheelspeed.txt"))
+    wheel_speeds = load_data(data_path, "wheelspeed.txt", t_limits)
 
-    plt.plot(wheel_speeds[:,0], wheel_speeds[:,1], label="left")
-    plt.plot(wheel_speeds[:,0], wheel_speeds[:,2], label="right")
+    plt.plot(wheel_speeds[:,0], wheel_speeds[:,1:3])
     if t_limits is not None:
         plt.xlim(t_limits)
     plt.xlabel("Time (s)")
     plt.ylabel("Speed")
-    plt.legend(loc='upper left', bbox_to_anchor=(1.0, 1.0))
+    plt.legend(["left", "right"], loc='upper left', bbox_to_anchor=(1.0, 1.0))
     plt.title("wheel_speeds")
     plt.tight_layout()
 
 
+# Plots (in order of making)
+plots = collections.OrderedDict([
+    ('bot_pos_aerial', plot_bot_pos_aerial),
+    ('bot_pos', plot_bot_pos),
+    ('bot_orient', plot_bot_orient),
+    ('global_vec', plot_global_vec),
+    ('goal_input', plot_goal_input),
+    ('goal', plot_goal),
+    ('gate_target_vec_goal', plot_gate_target_vec_goal),
+    ('gate_target_vec', plot_gate_target_vec),
+    ('gate_routept_cleanup', plot_gate_routept_cleanup),
+    ('catch_area', plot_catch_area),
+    ('catch_area_norm', plot_catch_area_norm),
+    ('vision', plot_vision),
+    ('view', plot_view),
+    ('goal0view', plot_goal0view),
+    ('gate_view_routept', plot_gate_view_routept),
+    ('view_routept', plot_view_routept),
+    ('prev_routept', plot_prev_routept),
+    ('routept_cleanup', plot_routept_cleanup),
+    ('prev2next_routepts', plot_prev2next_routepts),
+    ('next_routept', plot_next_routept),
+    ('goal_detect', plot_goal_detect),
+    ('routepts2views', plot_routepts2views),
+    ('view7view', plot_view7view),
+    ('gain_catch_vec', plot_gain_catch_vec),
+    ('goals2goals_vecs', plot_goals2goals_vecs),
+    ('target_vec', plot_target_vec),
+    ('norm_target_vec', plot_norm_target_vec),
+    ('scaled_target_vec', plot_scaled_target_vec),
+    ('routepts2norm_local_vecs', plot_routepts2norm_local_vecs),
+    ('scaled_local_vec', plot_scaled_local_vec),
+    ('catch_vec', plot_catch_vec),
+    ('scaled_catch_vec', plot_scaled_catch_vec),
+    ('motion_vec', plot_motion_vec),
+    ('wheel_speeds', plot_wheel_speeds),
+    ('displace', plot_displace),
+    ('gate_reset', plot_gate_reset),
+    ('action_names', plot_action_names),
+    ('thal', plot_thal),
+    ])
+
+
 # Process command line arguments
 parser = argparse.ArgumentParser()
 parser.add_argument(
@@ -770,12 +812,12 @@ args = parser.parse_args()
 data_path = args.data_dirname
 if args.plotnames:
     plotnames = \
-        [plotname for plotnames in args.plotnames for plotname in plotnames]
+        {plotname for plotnames in args.plotnames for plotname in plotnames}
     for plotname in plotnames:
-        if 'plot_{}'.format(plotname) not in globals():
+        if plotname not in plots:
             raise ValueError("Plot '{}' is not supported.".format(plotname))
 else:
-    plotnames = []
+    plotnames = set()
 if args.params:
     for param in args.params:
         paramname, paramval = map(lambda x: x.strip(), param.split("=", 1))
@@ -790,82 +832,9 @@ if args.params:
                              "".format(paramname))
 
 # Make plots
-if not plotnames or 'bot_pos_aerial' in plotnames:
-    plot_bot_pos_aerial(data_path, params)
-if not plotnames or 'bot_pos' in plotnames:
-    plot_bot_pos(data_path, params)
-if not plotnames or 'bot_orient' in plotnames:
-    plot_bot_orient(data_path, params)
-if not plotnames or 'global_vec' in plotnames:
-    plot_global_vec(data_path, params)
-if not plotnames or 'goal_input' in plotnames:
-    plot_goal_input(data_path, params)
-if not plotnames or 'goal' in plotnames:
-    plot_goal(data_path, params)
-if not plotnames or 'gate_target_vec_goal' in plotnames:
-    plot_gate_target_vec_goal(data_path, params)
-if not plotnames or 'gate_target_vec' in plotnames:
-    plot_gate_target_vec(data_path, params)
-if not plotnames or 'gate_routept_cleanup' in plotnames:
-    plot_gate_routept_cleanup(data_path, params)
-if not plotnames or 'catch_area' in plotnames:
-    plot_catch_area(data_path, params)
-if not plotnames or 'catch_area_norm' in plotnames:
-    plot_catch_area_norm(data_path, params)
-if not plotnames or 'vision' in plotnames:
-    plot_vision(data_path, params)
-if not plotnames or 'view' in plotnames:
-    plot_view(data_path, params)
-if not plotnames or 'goal0view' in plotnames:
-    plot_goal0view(data_path, params)
-if not plotnames or 'gate_view_routept' in plotnames:
-    plot_gate_view_routept(data_path, params)
-if not plotnames or 'view_routept' in plotnames:
-    plot_view_routept(data_path, params)
-if not plotnames or 'prev_routept' in plotnames:
-    plot_prev_routept(data_path, params)
-if not plotnames or 'routept_cleanup' in plotnames:
-    plot_routept_cleanup(data_path, params)
-if not plotnames or 'prev2next_routepts' in plotnames:
-    plot_prev2next_routepts(data_path, params)
-if not plotnames or 'next_routept' in plotnames:
-    plot_next_routept(data_path, params)
-if not plotnames or 'goal_detect' in plotnames:
-    plot_goal_detect(data_path, params)
-if not plotnames or 'routepts2views' in plotnames:
-    plot_routepts2views(data_path, params)
-if not plotnames or 'view7view' in plotnames:
-    plot_view7view(data_path, params)
-if not plotnames or 'gain_catch_vec' in plotnames:
-    plot_gain_catch_vec(data_path, params)
-if not plotnames or 'goals2goals_vecs' in plotnames:
-    plot_goals2goals_vecs(data_path, params)
-if not plotnames or 'target_vec' in plotnames:
-    plot_target_vec(data_path, params)
-if not plotnames or 'norm_target_vec' in plotnames:
-    plot_norm_target_vec(data_path, params)
-if not plotnames or 'scaled_target_vec' in plotnames:
-    plot_scaled_target_vec(data_path, params)
-if not plotnames or 'routepts2norm_local_vecs' in plotnames:
-    plot_routepts2norm_local_vecs(data_path, params)
-if not plotnames or 'scaled_local_vec' in plotnames:
-    plot_scaled_local_vec(data_path, params)
-if not plotnames or 'catch_vec' in plotnames:
-    plot_catch_vec(data_path, params)
-if not plotnames or 'scaled_catch_vec' in plotnames:
-    plot_scaled_catch_vec(data_path, params)
-if not plotnames or 'motion_vec' in plotnames:
-    plot_motion_vec(data_path, params)
-if not plotnames or 'wheel_speeds' in plotnames:
-    plot_wheel_speeds(data_path, params)
-if not plotnames or 'displace' in plotnames:
-    plot_displace(data_path, params)
-if not plotnames or 'gate_reset' in plotnames:
-    plot_gate_reset(data_path, params)
-if not plotnames or 'action_names' in plotnames:
-    plot_action_names(data_path, params)
-if not plotnames or 'thal' in plotnames:
-    plot_thal(data_path, params)
+for plotname, plot in plots.items():
+    if not plotnames or plotname in plotnames:
+        plot(data_path, params)
 
 # Show figures
 plt.show()
@@ -1,4 +1,5 @@
 import argparse
+import ast
 import os
 
 import matplotlib.pyplot as plt
@@ -9,7 +10,7 @@ plots = {
     'gain_catch_vec_neurons': "gaincatchvecnrn.npz",
     'goal_neurons': "goalnrn.npz",
     'motion_vec_neurons': "motionvecnrn.npz",
-    'next_routept_neurons': "prevrouteptnrn.npz",
+    'next_routept_neurons': "nextrouteptnrn.npz",
     'prev_routept_neurons': "prevrouteptnrn.npz",
     'target_vec_neurons': "targetvecnrn.npz",
     'thal_neurons': "thalnrn.npz",
@@ -26,12 +27,20 @@ params = {
 
 def cluster_spikes(t, spikes, params):
     """Cluster spike trains."""
+    active_neurons = spikes.any(axis=0)
+    n_active_neurons = active_neurons.sum()
     n_sampled_neurons = params['cluster_spikes.n_sampled_neurons']
     if n_sampled_neurons is None:
-        n_sampled_neurons = spikes.shape[1]
+        # By default sample all active neurons (unless there are too few of
+        # them to be clustered)
+        n_sampled_neurons = (n_active_neurons if n_active_neurons > 1
+                             else spikes.shape[1])
     n_plotted_neurons = params['cluster_spikes.n_plotted_neurons']
     if n_plotted_neurons is None:
         n_plotted_neurons = n_sampled_neurons
+    # Drop silent neurons, as they would not be sampled by variance anyway
+    if n_sampled_neurons <= n_active_neurons:
+        spikes = spikes[:,active_neurons]
 
     return neps.merge(
         *neps.cluster(*neps.sample_by_variance(t, spikes,
@@ -89,7 +98,7 @@ if args.params:
         paramname, paramval = map(lambda x: x.strip(), param.split("=", 1))
         if paramname in params:
             try:
-                params[paramname] = eval(paramval)
+                params[paramname] = ast.literal_eval(paramval)
             except Exception:
                 raise ValueError("Value of parameter '{}' is invalid."
                                  "".format(paramname))
@@ -9,6 +9,7 @@ position to the current robot position.
 __author__ = "Przemyslaw (Mack) Nowak"
 
 import nengo
+import numpy as np
 
 with_vrep = False
 if with_vrep:
@@ -80,21 +81,20 @@ try:
             bot_pos_inp = nengo.Node(bot_init_pos)
 
         # Create node representing global vector
-        global_vec = [0.0, 0.0]
+        global_vec = np.zeros(2)
         if with_vrep:
-            bot_prev_pos = bot.get_position()[0:2]
+            bot_prev_pos = np.array(bot.get_position()[0:2])
         else:
-            bot_prev_pos = bot_init_pos
+            bot_prev_pos = np.array(bot_init_pos, dtype=float)
 
         def update_global_vec(t, x):
-            global global_vec
-            global bot_prev_pos
-            bot_diff_pos = [x[0] - bot_prev_pos[0], x[1] - bot_prev_pos[1]]
-            if any(bot_diff_pos):
-                global_vec[0] += bot_diff_pos[0]
-                global_vec[1] += bot_diff_pos[1]
-                bot_prev_pos[0] += bot_diff_pos[0]
-                bot_prev_pos[1] += bot_diff_pos[1]
+            bot_diff_pos_x = x[0] - bot_prev_pos[0]
+            bot_diff_pos_y = x[1] - bot_prev_pos[1]
+            if bot_diff_pos_x or bot_diff_pos_y:
+                global_vec[0] += bot_diff_pos_x
+                global_vec[1] += bot_diff_pos_y
+                bot_prev_pos[0] += bot_diff_pos_x
+                bot_prev_pos[1] += bot_diff_pos_y
             return global_vec
 
         global_vec_inp = nengo.Node(update_global_vec, size_in=2, size_out=2)
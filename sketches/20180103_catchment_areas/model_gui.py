@@ -88,13 +88,13 @@ try:
         waypts_names = waypts_coll.get_names()
 
     # Validate radius of catchment areas
-    min_waypt_dist = 2 * params.catch_area_radius
-    for w, waypt1_pos in enumerate(waypts_pos):
-        for waypt2_pos in waypts_pos[w+1:]:
-            waypts_dist = np.sqrt(((waypt1_pos - waypt2_pos)**2).sum())
-            assert waypts_dist >= min_waypt_dist, \
-                ("Radius of catchment areas must be less than {}."
-                 "".format(waypts_dist / 2))
+    waypts_diffs = waypts_pos[:,np.newaxis] - waypts_pos
+    waypts_square_dists = (waypts_diffs**2).sum(axis=2)
+    np.fill_diagonal(waypts_square_dists, np.inf)
+    min_waypts_dist = np.sqrt(waypts_square_dists.min())
+    assert min_waypts_dist >= 2 * params.catch_area_radius, \
+        ("Radius of catchment areas must be less than {}."
+         "".format(min_waypts_dist / 2))
 
     # Create representation of the robot
     if with_vrep:
@@ -105,6 +105,9 @@ try:
     views_names = ["VIEW_"+waypt_name.upper() for waypt_name in waypts_names]
     views_vocab = spa.Vocabulary(params.sp_dim)
     views_vocab.extend(views_names)
+    views_vectors = np.array([views_vocab[view_name].v
+                              for view_name in views_names])
+    no_view = np.zeros(params.sp_dim)
 
     # Create communicator for data exchange with V-REP
     if with_vrep:
@@ -135,15 +138,20 @@ try:
             bot_orient_inp = nengo.Node(bot_init_orient_deg * np.pi / 180.0)
 
         # Create node representing view in catchment area
+        waypts_x = np.array(waypts_pos[:,0])
+        waypts_y = np.array(waypts_pos[:,1])
+        catch_area_radius = params.catch_area_radius
+        inv_catch_area_radius = 1.0 / catch_area_radius
+
         def update_catch_area_view(t, x):
-            waypts_dists = np.sqrt(((x - waypts_pos)**2).sum(axis=1))
-            min_waypt_dist = waypts_dists.min()
-            if min_waypt_dist < params.catch_area_radius:
-                view_name = views_names[waypts_dists.argmin()]
-                gain = 1.0 - (min_waypt_dist / params.catch_area_radius)
-                return gain * views_vocab[view_name].v
+            waypts_square_dists = (waypts_x - x[0])**2 + (waypts_y - x[1])**2
+            w = waypts_square_dists.argmin()
+            min_waypt_dist = np.sqrt(waypts_square_dists[w])
+            if min_waypt_dist < catch_area_radius:
+                gain = 1.0 - min_waypt_dist * inv_catch_area_radius
+                return gain * views_vectors[w]
             else:
-                return [0.0] * params.sp_dim
+                return no_view
 
         catch_area_view_inp = nengo.Node(update_catch_area_view, size_in=2,
                                          size_out=params.sp_dim)
@@ -28,7 +28,7 @@ import nengo
 import nengo.spa as spa
 import numpy as np
 
-waypts_pos = [0.0, 2.0, 4.0, 6.0]
+waypts_pos = np.array([0.0, 2.0, 4.0, 6.0])
 waypts_names = ["NEST", "WAYPOINT1", "WAYPOINT2", "FEED"]
 goals_names = ["NEST", "FEED"]
 
@@ -54,6 +54,9 @@ assert min_waypts_dist > params.catch_area_radius * 2, \
 views_names = ["VIEW_"+waypt_name for waypt_name in waypts_names]
 views_vocab = spa.Vocabulary(params.sp_dim, unitary=params.unitary_sps)
 views_vocab.extend(views_names)
+views_vectors = np.array([views_vocab[view_name].v
+                          for view_name in views_names])
+no_view = np.zeros(params.sp_dim)
 goals_vocab = spa.Vocabulary(params.sp_dim, unitary=params.unitary_sps)
 goals_vocab.extend(goals_names)
 routepts_vocab = spa.Vocabulary(params.sp_dim)
@@ -71,15 +74,18 @@ with model:
     model.bot_pos_inp = nengo.Node([0], size_out=1)
 
     # Create node representing current view
+    catch_area_radius = params.catch_area_radius
+    inv_catch_area_radius = 1.0 / catch_area_radius
+
     def update_view(t, x):
-        waypts_dists = np.sqrt(((x - waypts_pos)**2))
-        min_waypt_dist = waypts_dists.min()
-        if min_waypt_dist < params.catch_area_radius:
-            view_name = views_names[waypts_dists.argmin()]
-            gain = 1.0 - (min_waypt_dist / params.catch_area_radius)
-            return gain * views_vocab[view_name].v
+        waypts_dists = np.abs(x - waypts_pos)
+        w = waypts_dists.argmin()
+        min_waypt_dist = waypts_dists[w]
+        if min_waypt_dist < catch_area_radius:
+            gain = 1.0 - min_waypt_dist * inv_catch_area_radius
+            return gain * views_vectors[w]
         else:
-            return [0.0] * params.sp_dim
+            return no_view
 
     model.view_inp = nengo.Node(update_view, size_in=1, size_out=params.sp_dim)
     nengo.Connection(model.bot_pos_inp, model.view_inp, synapse=None)
@@ -37,6 +37,8 @@ the robot position, which must be manually changed using Nengo GUI.
 
 __author__ = "Przemyslaw (Mack) Nowak"
 
+import math
+
 import nengo
 import nengo.spa as spa
 import numpy as np
@@ -56,6 +58,8 @@ params.unitary_sps = True
 # Create vocabulary
 waypts_vocab = spa.Vocabulary(params.sp_dim, unitary=params.unitary_sps)
 waypts_vocab.extend(waypts_names)
+waypts_vectors = np.array([waypts_vocab[waypt_name].v
+                           for waypt_name in waypts_names])
 
 # Create Nengo model
 model = spa.SPA()
@@ -65,7 +69,7 @@ with model:
 
     # Create node representing next waypoint
     def update_next_waypt(t, x):
-        return waypts_vocab[waypts_names[int(np.floor(x + 0.5))]].v
+        return waypts_vectors[int(math.floor(x[0] + 0.5))]
 
     next_waypt_inp = nengo.Node(update_next_waypt, size_in=1,
                                 size_out=params.sp_dim)
@@ -73,10 +73,13 @@ with model:
     bot_pos_inp = nengo.Node(0)
 
     # Create node representing vision
+    views_vectors = np.array([views_vocab[k].v for k in views_sp_keys])
+    view = np.empty(params.sp_dim)
+
     def update_vision(t, x):
-        waypt_idx = int(round(x))
-        scale = 1.0 - (abs(x - waypt_idx) / 0.5)
-        return scale * views_vocab[views_sp_keys[waypt_idx]].v
+        waypt_idx = int(round(x[0]))
+        scale = 1.0 - (abs(x[0] - waypt_idx) / 0.5)
+        return np.multiply(views_vectors[waypt_idx], scale, out=view)
 
     vision_inp = nengo.Node(update_vision, size_in=1, size_out=params.sp_dim)
     nengo.Connection(bot_pos_inp, vision_inp, synapse=None)
@@ -30,6 +30,8 @@ which depends on the direction to the goal.
 
 __author__ = "Przemyslaw (Mack) Nowak"
 
+import math
+
 import nengo
 import numpy as np
 import simtools
@@ -144,10 +146,10 @@ try:
 
         # Create node representing motion vector
         def update_motion_vec(t, x):
-            goal_vec = x[3:5] - x[0:2]
-            c, s = np.cos(-x[2]), np.sin(-x[2])
-            goal_rot = np.array([[c, -s], [s, c]], dtype=float)
-            return np.dot(goal_rot, goal_vec)
+            goal_vec_x = x[3] - x[0]
+            goal_vec_y = x[4] - x[1]
+            c, s = math.cos(-x[2]), math.sin(-x[2])
+            return [c*goal_vec_x - s*goal_vec_y, s*goal_vec_x + c*goal_vec_y]
 
         motion_vec_inp = nengo.Node(update_motion_vec, size_in=5, size_out=2)
         nengo.Connection(bot_pos_inp, motion_vec_inp[0:2], synapse=None)
@@ -155,18 +157,25 @@ try:
         nengo.Connection(goal_pos_inp, motion_vec_inp[3:5], synapse=None)
 
         # Create node representing wheel speeds
+        goal_dist_square_margin = params.goal_dist_margin**2
+        theta_thres = params.theta_thres
+        default_wheel_speed = params.default_wheel_speed
+        no_wheel_speeds = np.zeros(3)
+        new_wheel_speeds = np.empty(3)
+
         def update_wheel_speeds(t, x):
-            if np.sqrt((x**2).sum()) < params.goal_dist_margin:
-                return [0.0, 0.0, 0.0]  # stop
-            theta = np.arctan2(x[1], x[0])
-            if -params.theta_thres < theta < params.theta_thres:
-                return [params.default_wheel_speed - theta,
-                        params.default_wheel_speed + theta,
-                        1.0]  # (curvilinear) motion forward
+            if x[0]*x[0] + x[1]*x[1] < goal_dist_square_margin:
+                return no_wheel_speeds  # stop
+            theta = math.atan2(x[1], x[0])
+            if -theta_thres < theta < theta_thres:
+                new_wheel_speeds[0] = default_wheel_speed - theta
+                new_wheel_speeds[1] = default_wheel_speed + theta
+                new_wheel_speeds[2] = 1.0  # (curvilinear) motion forward
             else:
-                return [-params.default_wheel_speed * theta,
-                        params.default_wheel_speed * theta,
-                        -1.0]  # rotation on the spot
+                new_wheel_speeds[0] = -default_wheel_speed * theta
+                new_wheel_speeds[1] = default_wheel_speed * theta
+                new_wheel_speeds[2] = -1.0  # rotation on the spot
+            return new_wheel_speeds
 
         wheel_speeds = nengo.Node(update_wheel_speeds, size_in=2, size_out=3)
         nengo.Connection(motion_vec_inp, wheel_speeds,
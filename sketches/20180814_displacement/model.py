@@ -9,6 +9,7 @@ in motion.
 __author__ = "Przemyslaw (Mack) Nowak"
 
 import nengo
+import numpy as np
 import vrepsim as vrs
 
 # --- PARAMETERS ---
@@ -79,15 +80,20 @@ try:
         vrep_proxy = nengo.Node(vrep_comm, size_in=2, size_out=0)
 
         # Create node representing wheel speeds
+        stop_bot_before_move = params.stop_bot_before_move
+        t_stop_start = params.sim_duration - 1.0
+        t_stop_end = params.sim_duration + 1.0
+        move_wheel_speeds = np.array([5.0, 5.0])
+        stop_wheel_speeds = np.zeros(2)
+
         def update_wheel_speeds(t):
-            if params.stop_bot_before_move:
-                if (t < params.sim_duration - 1.0
-                    or t > params.sim_duration + 1.0):
-                    return [5.0, 5.0]
+            if stop_bot_before_move:
+                if t < t_stop_start or t > t_stop_end:
+                    return move_wheel_speeds
                 else:
-                    return [0.0, 0.0]
+                    return stop_wheel_speeds
             else:
-                return [5.0, 5.0]
+                return move_wheel_speeds
 
         wheel_speeds = nengo.Node(update_wheel_speeds, size_in=0)
         vrep_comm.add_input(bot.wheels.set_velocities, 2)
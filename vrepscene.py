@@ -38,7 +38,7 @@ class Scene(object):
 
         # Retrieve positions of goals
         goals_pos = goals_coll.get_positions()
-        self.goals_pos = np.array(goals_pos, dtype=float)[:,:2]
+        self.goals_pos = np.array([pos[:2] for pos in goals_pos], dtype=float)
 
         # Retrieve names of waypoints
         waypts_coll = vrs.Collection(self.vrep_sim, self.waypts_coll_name)
@@ -46,7 +46,8 @@ class Scene(object):
 
         # Retrieve positions of waypoints
         waypts_pos = waypts_coll.get_positions()
-        self.waypts_pos = np.array(waypts_pos, dtype=float)[:,:2]
+        self.waypts_pos = np.array([pos[:2] for pos in waypts_pos],
+                                   dtype=float)
 
         # Retrieve names of routes
         self.routes_names = []
@@ -67,9 +68,38 @@ class Scene(object):
                                     for route_coll in routes_colls]
 
         # Retrieve positions of route waypoints
-        self.routes_waypts_pos = \
-            [np.array(route_coll.get_positions(), dtype=float)[:,:2]
-             for route_coll in routes_colls]
+        routes_waypts_pos = [route_coll.get_positions()
+                             for route_coll in routes_colls]
+        self.routes_waypts_offsets = np.cumsum(
+            [0] + [len(route_waypts_pos)
+                   for route_waypts_pos in routes_waypts_pos])
+        self.all_routes_waypts_pos = np.array(
+            [pos[:2] for route_waypts_pos in routes_waypts_pos
+             for pos in route_waypts_pos], dtype=float
+            )  # contiguous array of positions of all route waypoints
+        self.routes_waypts_pos = np.split(
+            self.all_routes_waypts_pos,
+            self.routes_waypts_offsets[1:-1])  # list of views
+
+        # Map names of goals, waypoints, and routes to their indices
+        self._goals_idxs = dict(
+            (name, i) for i, name in enumerate(self.goals_names))
+        self._waypts_idxs = dict(
+            (name, i) for i, name in enumerate(self.waypts_names))
+        self._routes_idxs = dict(
+            (name, i) for i, name in enumerate(self.routes_names))
+
+    def goal_index(self, goal_name):
+        """Return index of a goal."""
+        return self._goals_idxs[goal_name]
+
+    def route_index(self, route_name):
+        """Return index of a route."""
+        return self._routes_idxs[route_name]
+
+    def waypt_index(self, waypt_name):
+        """Return index of a waypoint."""
+        return self._waypts_idxs[waypt_name]
 
     def move_bot(self, new_pos, new_orient=None):
         """Instantly move robot to a new position."""